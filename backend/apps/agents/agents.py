@@ -2,16 +2,20 @@
 LangGraph agents: Retriever, Correlator, Recommender.
 Stateless functions that read/write AgentState.
 """
+import hashlib
 import json
 import logging
 import os
-import re
+import threading
+import time
 import urllib.request
-from typing import Any
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Iterator
 
 from langchain_ollama import ChatOllama
 
-from apps.memory.graph_builder import KubeGraphBuilder
+from apps.memory.graph_builder import KubeGraphBuilder, get_shared_graph
 from apps.memory.vector_store import IncidentVectorStore
 
 from .state import AgentState
@@ -21,20 +25,80 @@ logger = logging.getLogger(__name__)
 # Fallback chat models to try if OLLAMA_CHAT_MODEL is not available (small, fast).
 OLLAMA_CHAT_FALLBACKS = ("qwen2.5:0.5b", "phi3:mini", "llama3.2:3b", "llama3.2:1b", "mistral:7b")
 
+# Process-wide store handle, created on first use; the Chroma client lives for the worker's
+# lifetime. The Neo4j graph is shared via apps.memory.graph_builder.get_shared_graph().
+_STORE: IncidentVectorStore | None = None
+_singleton_lock = threading.Lock()
+
+
+def _get_store() -> IncidentVectorStore:
+    """Return the shared IncidentVectorStore, creating it on first use."""
+    global _STORE
+    if _STORE is None:
+        with _singleton_lock:
+            if _STORE is None:
+                _STORE = IncidentVectorStore()
+    return _STORE
+
+
+def _reset_store() -> None:
+    """Drop the shared store so the next call reconnects (e.g. collection was recreated)."""
+    global _STORE
+    with _singleton_lock:
+        _STORE = None
+
+
+def _get_graph() -> KubeGraphBuilder:
+    """Return the process-wide KubeGraphBuilder shared with the API views."""
+    return get_shared_graph()
+
+
+# /api/tags results per base URL: {base_url: (fetched_at_monotonic, models)}.
+# Saves an HTTP round-trip per agent call; only successful listings are cached.
+OLLAMA_MODELS_CACHE_TTL = 60.0
+_ollama_models_cache: dict[str, tuple[float, list[str]]] = {}
+
 
 def _get_available_ollama_models(base_url: str) -> list[str]:
-    """Return list of model names available on the Ollama server."""
+    """
+    Return list of model names available on the Ollama server
+    (cached for OLLAMA_MODELS_CACHE_TTL).
+    """
+    key = base_url.rstrip("/")
+    cached = _ollama_models_cache.get(key)
+    if cached and time.monotonic() - cached[0] < OLLAMA_MODELS_CACHE_TTL:
+        return cached[1]
     try:
         req = urllib.request.Request(
-            f"{base_url.rstrip('/')}/api/tags",
+            f"{key}/api/tags",
             headers={"Accept": "application/json"},
         )
         with urllib.request.urlopen(req, timeout=5) as resp:
             data = json.loads(resp.read().decode())
-        return [m.get("name", "") for m in data.get("models", []) if m.get("name")]
+        models = [m.get("name", "") for m in data.get("models", []) if m.get("name")]
     except Exception as e:
         logger.warning("Could not list Ollama models at %s: %s", base_url, e)
         return []
+    if models:
+        _ollama_models_cache[key] = (time.monotonic(), models)
+    return models
+
+
+def invalidate_ollama_models(base_url: str) -> None:
+    """Forget the cached model list for base_url (e.g. after an Ollama call failed)."""
+    _ollama_models_cache.pop(base_url.rstrip("/"), None)
+
+
+# Concurrent generations allowed per process. Match Ollama's OLLAMA_NUM_PARALLEL so batch
+# analyses queue here instead of piling up (and timing out) inside the Ollama server.
+_ollama_slots = threading.BoundedSemaphore(int(os.environ.get("OLLAMA_NUM_PARALLEL") or 4))
+
+
+def _invoke_llm(llm: ChatOllama, prompt: str) -> str:
+    """Run one generation within the process-wide Ollama concurrency limit; return text content."""
+    with _ollama_slots:
+        response = llm.invoke(prompt)
+    return getattr(response, "content", None) or str(response)
 
 
 def get_working_chat_model(
@@ -67,15 +131,111 @@ def get_working_chat_model(
     return first
 
 
+# ChatOllama clients keyed on (base_url, model, timeout, format); reusing one keeps its HTTP
+# connection pool warm instead of rebuilding client state on every agent call.
+_chat_clients: dict[tuple[str, str, int, str], ChatOllama] = {}
+
+# How long Ollama keeps the chat model loaded after a request (Ollama's default is 5m).
+# Keeping it resident avoids a multi-second model load on the first incident after idle.
+OLLAMA_KEEP_ALIVE = os.environ.get("OLLAMA_KEEP_ALIVE") or "30m"
+
+
+def _get_llm(base_url: str, timeout: int, json_output: bool = False) -> ChatOllama | None:
+    """
+    Return a shared ChatOllama for the working chat model at base_url, or None if none is available.
+    json_output=True constrains decoding to a JSON object (Ollama format="json").
+    """
+    model = get_working_chat_model(base_url=base_url)
+    if not model:
+        return None
+    fmt = "json" if json_output else ""
+    key = (base_url, model, timeout, fmt)
+    llm = _chat_clients.get(key)
+    if llm is None:
+        llm = _chat_clients.setdefault(
+            key,
+            ChatOllama(
+                model=model,
+                base_url=base_url,
+                timeout=timeout,
+                keep_alive=OLLAMA_KEEP_ALIVE,
+                format=fmt,
+            ),
+        )
+    return llm
+
+
+def prewarm_chat_model() -> None:
+    """
+    Load the chat model into Ollama memory with a tiny prompt so the first real analysis
+    doesn't pay the model load. Never raises; meant to run in a background thread.
+    """
+    ollama_url = os.environ.get("OLLAMA_BASE_URL") or "http://localhost:11434"
+    try:
+        llm = _get_llm(ollama_url, timeout=60)
+        if llm is not None:
+            _invoke_llm(llm, "ping")
+            logger.info("Prewarmed Ollama chat model %s", llm.model)
+    except Exception as e:
+        logger.warning("Ollama prewarm failed: %s", e)
+
+
+def prewarm_vector_store() -> None:
+    """
+    Open the shared IncidentVectorStore (Chroma client + embedding function) ahead of the
+    first retrieval. Never raises; meant to run in a background thread.
+    """
+    try:
+        _get_store()
+        logger.info("Prewarmed incident vector store")
+    except Exception as e:
+        logger.warning("Vector store prewarm failed: %s", e)
+
+
+# Per-item excerpt length used in LLM prompts; sliced once when results enter the state.
+CONTENT_EXCERPT_CHARS = 300
+
+
 def _to_similar_item(row: dict[str, Any]) -> dict[str, Any]:
-    """Map vector store result to {content, score, metadata} for state."""
+    """
+    Map vector store result to {content, score, metadata} for state, plus the metadata
+    fields the prompt and sources read, flattened to top-level keys once per row.
+    """
+    metadata = row.get("metadata") or {}
+    content = row.get("document", "") or ""
     return {
-        "content": row.get("document", "") or "",
+        "content": content,
+        "content_excerpt": content[:CONTENT_EXCERPT_CHARS],
         "score": row.get("similarity_score", 0.0),
-        "metadata": row.get("metadata", {}),
+        "metadata": metadata,
+        "occurred_at": metadata.get("occurred_at", "unknown"),
+        "incident_type": metadata.get("incident_type", ""),
+        "pod_name": metadata.get("pod_name", ""),
+        "incident_id": metadata.get("incident_id"),
     }
 
 
+def _retriever_query(incident_type: str, pod_name: str, namespace: str, description: str) -> str:
+    """Build the semantic search text for an incident."""
+    return f"{incident_type} {pod_name} {namespace} {description}".strip() or "Kubernetes incident"
+
+
+@lru_cache(maxsize=128)
+def _query_embedding(
+    incident_type: str,
+    pod_name: str,
+    namespace: str,
+    description: str,
+) -> tuple[float, ...]:
+    """
+    Embed the retriever query once per incident signature.
+    Retries and reanalyze calls for the same incident reuse the cached vector.
+    Failures are not cached (lru_cache does not store raised exceptions).
+    """
+    query = _retriever_query(incident_type, pod_name, namespace, description)
+    return tuple(_get_store().embed(query))
+
+
 def retriever_agent(state: AgentState) -> AgentState:
     """
     Semantic search in ChromaDB: similar incidents, past fixes, corrections.
@@ -87,43 +247,40 @@ def retriever_agent(state: AgentState) -> AgentState:
     corrections: list[dict] = []
 
     try:
-        query = (
-            f"{state.get('incident_type', '')} {state.get('pod_name', '')} "
-            f"{state.get('namespace', '')} {state.get('description', '')}"
-        ).strip() or "Kubernetes incident"
+        signature = (
+            state.get("incident_type", ""),
+            state.get("pod_name", ""),
+            state.get("namespace", ""),
+            state.get("description", ""),
+        )
+        query = _retriever_query(*signature)
 
-        store = IncidentVectorStore()
+        store = _get_store()
 
-        # Similar incidents: namespace filter; exclude fix/correction by filtering results
-        raw_similar = store.search_similar(
+        # One (cached) embedding round-trip to Ollama serves all three filtered searches.
+        raw_similar, raw_fixes, raw_corrections = store.search_similar_batch(
             query,
-            n_results=5,
-            filter_namespace=state.get("namespace"),
+            [
+                # Similar incidents: namespace filter; fix/correction docs excluded in the index
+                {
+                    "n_results": 5,
+                    "filter_namespace": state.get("namespace"),
+                    "exclude_doc_types": ["fix", "correction"],
+                },
+                {"n_results": 3, "doc_type": "fix"},
+                {"n_results": 5, "doc_type": "correction"},
+            ],
+            query_embedding=list(_query_embedding(*signature)),
         )
-        for r in raw_similar:
-            doc_type = (r.get("metadata") or {}).get("doc_type")
-            if doc_type not in ("fix", "correction"):
-                similar_incidents.append(_to_similar_item(r))
 
-        # Past fixes
-        raw_fixes = store.search_similar(
-            query,
-            n_results=3,
-            doc_type="fix",
-        )
+        similar_incidents = [_to_similar_item(r) for r in raw_similar]
         past_fixes = [_to_similar_item(r) for r in raw_fixes]
-
-        # Corrections
-        raw_corrections = store.search_similar(
-            query,
-            n_results=5,
-            doc_type="correction",
-        )
         corrections = [_to_similar_item(r) for r in raw_corrections]
 
     except Exception as e:
         logger.exception("retriever_agent failed: %s", e)
         errors.append(f"Retriever: {e!s}")
+        _reset_store()
 
     state["similar_incidents"] = similar_incidents
     state["past_fixes"] = past_fixes
@@ -143,18 +300,15 @@ def correlator_agent(state: AgentState) -> AgentState:
     deploy_correlation: dict | None = None
 
     try:
-        graph = KubeGraphBuilder()
-        try:
-            pod_name = state.get("pod_name", "")
-            namespace = state.get("namespace", "")
-            causal_patterns = graph.find_causal_patterns(pod_name, namespace)
-            blast_radius = graph.find_blast_radius(pod_name, namespace)
-
-            incident_id = state.get("incident_id")
-            if incident_id is not None:
-                deploy_correlation = graph.get_deploy_correlation_for_incident(incident_id)
-        finally:
-            graph.close()
+        graph = _get_graph()
+        pod_name = state.get("pod_name", "")
+        namespace = state.get("namespace", "")
+        causal_patterns = graph.find_causal_patterns(pod_name, namespace)
+        blast_radius = graph.find_blast_radius(pod_name, namespace)
+
+        incident_id = state.get("incident_id")
+        if incident_id is not None:
+            deploy_correlation = graph.get_deploy_correlation_for_incident(incident_id)
     except Exception as e:
         logger.exception("correlator_agent failed: %s", e)
         errors.append(f"Correlator: {e!s}")
@@ -166,46 +320,86 @@ def correlator_agent(state: AgentState) -> AgentState:
     return state
 
 
-def _build_prompt(state: AgentState) -> str:
-    """Build the SRE analysis prompt from pipeline state."""
-    similar = state.get("similar_incidents") or []
-    similar_text = "\n".join([
-        f"- [{s.get('metadata', {}).get('occurred_at', 'unknown')}] "
-        f"{s.get('metadata', {}).get('incident_type', '')} on "
-        f"{s.get('metadata', {}).get('pod_name', '')}: {s.get('content', '')[:200]}"
-        for s in similar
-    ])
+# Character budget for retrieved context in LLM prompts (a proxy for input tokens, which
+# dominate Ollama latency). Sections are filled in priority order; least relevant items drop first.
+PROMPT_CONTEXT_BUDGET = 4000
+
+
+def _rank_context(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Sort retrieved items by similarity score (best first), dropping repeated contents."""
+    seen: set[str] = set()
+    ranked: list[dict[str, Any]] = []
+    for item in sorted(items, key=lambda i: i.get("score") or 0.0, reverse=True):
+        content = item.get("content", "")
+        if content in seen:
+            continue
+        seen.add(content)
+        ranked.append(item)
+    return ranked
 
-    fixes = state.get("past_fixes") or []
-    fixes_text = "\n".join([f"- {f.get('content', '')[:200]}" for f in fixes])
 
-    corrections_list = state.get("corrections") or []
+def _take_within_budget(lines: list[str], budget: int) -> tuple[list[str], int]:
+    """Keep leading lines while they fit in budget chars; return (kept, remaining budget)."""
+    kept: list[str] = []
+    for line in lines:
+        if len(line) > budget:
+            break
+        kept.append(line)
+        budget -= len(line) + 1
+    return kept, budget
+
+
+def _build_prompt(state: AgentState) -> str:
+    """Build the SRE analysis prompt from pipeline state, bounded by PROMPT_CONTEXT_BUDGET."""
+    budget = PROMPT_CONTEXT_BUDGET
+
+    corrections_list = _rank_context(state.get("corrections") or [])
+    corrections_lines, budget = _take_within_budget(
+        [f"- CORRECTION OVERRIDE: {c['content_excerpt']}" for c in corrections_list],
+        budget,
+    )
     corrections_text = (
-        "\n".join([f"- CORRECTION OVERRIDE: {c.get('content', '')[:200]}" for c in corrections_list])
-        if corrections_list
-        else "No corrections recorded."
+        "\n".join(corrections_lines) if corrections_lines else "No corrections recorded."
     )
 
+    fixes = _rank_context(state.get("past_fixes") or [])
+    fixes_lines, budget = _take_within_budget(
+        [f"- {f['content_excerpt']}" for f in fixes],
+        budget,
+    )
+    fixes_text = "\n".join(fixes_lines)
+
+    similar = _rank_context(state.get("similar_incidents") or [])
+    similar_lines, budget = _take_within_budget(
+        [
+            f"- [{s['occurred_at']}] {s['incident_type']} on {s['pod_name']}: "
+            f"{s['content_excerpt']}"
+            for s in similar
+        ],
+        budget,
+    )
+    similar_text = "\n".join(similar_lines)
+
     patterns = state.get("causal_patterns") or []
-    patterns_text = (
-        "\n".join([
+    patterns_lines, budget = _take_within_budget(
+        [
             f"- {p.get('incident_type', '')}: occurred {p.get('frequency', 0)} times. "
             f"Fixes that worked: {p.get('fixes_that_worked', [])}"
             for p in patterns
-        ])
-        if patterns
-        else "No historical patterns found."
+        ],
+        budget,
     )
+    patterns_text = "\n".join(patterns_lines) if patterns_lines else "No historical patterns found."
 
     blast = state.get("blast_radius") or []
-    blast_text = (
-        ", ".join([
+    blast_parts, budget = _take_within_budget(
+        [
             f"{b.get('affected_pod', '')} (co-occurred {b.get('co_occurrence', 0)}x)"
             for b in blast
-        ])
-        if blast
-        else "No blast radius detected."
+        ],
+        budget,
     )
+    blast_text = ", ".join(blast_parts) if blast_parts else "No blast radius detected."
 
     deploy = state.get("deploy_correlation")
     if deploy:
@@ -246,18 +440,60 @@ Logs (excerpt): {(state.get('raw_logs') or '')[:300]}
 === DEPLOYMENT CORRELATION ===
 {deploy_text}
 
-Based ONLY on the above cluster-specific data, provide your analysis in this EXACT format:
+Based ONLY on the above cluster-specific data, respond with a single JSON object
+with exactly these keys:
 
-ROOT_CAUSE: [one sentence, reference specific cluster history]
-RECOMMENDATION: [specific fix steps, reference what worked before in this cluster]
-BLAST_RADIUS_WARNING: [which services to check, based on history]
-PREVENTION: [specific preventive action based on recurring patterns]
-CONFIDENCE: [0.0-1.0, higher if similar incidents found in history]
+{{
+  "root_cause": "one sentence, reference specific cluster history",
+  "recommendation": "specific fix steps, reference what worked before in this cluster",
+  "blast_radius_warning": "which services to check, based on history",
+  "prevention": "specific preventive action based on recurring patterns",
+  "confidence": 0.0 to 1.0 as a number, higher if similar incidents found in history
+}}
 """
 
 
+# Response label -> output key. BLAST_RADIUS_WARNING only delimits the sections around it.
+_RESPONSE_LABELS: dict[str, str | None] = {
+    "ROOT_CAUSE": "root_cause",
+    "RECOMMENDATION": "recommendation",
+    "BLAST_RADIUS_WARNING": None,
+    "PREVENTION": "prevention_advice",
+    "CONFIDENCE": "confidence",
+}
+
+
+def _match_label(line: str) -> tuple[str, str] | None:
+    """If line starts a labelled section ("LABEL: value"), return (label, inline value)."""
+    head = line.lstrip(" \t*#-")
+    upper = head.upper()
+    for label in _RESPONSE_LABELS:
+        if upper.startswith(label):
+            rest = head[len(label):].lstrip(" \t*")
+            if rest.startswith(":"):
+                return label, rest[1:].strip(" \t*")
+    return None
+
+
+def _leading_float(text: str) -> float | None:
+    """Parse the numeric prefix of text ("0.8 (3 matches)" -> 0.8); None if there is none."""
+    end = 0
+    text = text.strip()
+    while end < len(text) and (text[end].isdigit() or text[end] == "."):
+        end += 1
+    try:
+        return float(text[:end])
+    except ValueError:
+        return None
+
+
 def _parse_llm_response(text: str) -> dict[str, Any]:
-    """Parse ROOT_CAUSE, RECOMMENDATION, PREVENTION, CONFIDENCE from LLM output."""
+    """
+    Parse ROOT_CAUSE, RECOMMENDATION, PREVENTION, CONFIDENCE from labelled LLM text
+    (fallback for models that ignore JSON mode). Single pass over the lines: a label line
+    starts a section that runs until the next label.
+    The first occurrence of a label wins.
+    """
     out: dict[str, Any] = {
         "root_cause": "",
         "recommendation": "",
@@ -267,89 +503,235 @@ def _parse_llm_response(text: str) -> dict[str, Any]:
     if not text:
         return out
 
-    labels = ["ROOT_CAUSE", "RECOMMENDATION", "BLAST_RADIUS_WARNING", "PREVENTION", "CONFIDENCE"]
-    for i, label in enumerate(labels):
-        pattern = re.compile(
-            rf"{re.escape(label)}\s*[:\s]*(.*?)(?=\n(?:{'|'.join(labels[i+1:])})\s*:|\Z)",
-            re.DOTALL | re.IGNORECASE,
-        )
-        m = pattern.search(text)
-        if m:
-            val = m.group(1).strip()
-            if label == "ROOT_CAUSE":
-                out["root_cause"] = val
-            elif label == "RECOMMENDATION":
-                out["recommendation"] = val
-            elif label == "PREVENTION":
-                out["prevention_advice"] = val
-            elif label == "CONFIDENCE":
-                try:
-                    out["confidence"] = max(0.0, min(1.0, float(val)))
-                except ValueError:
-                    pass
-
-    conf_m = re.search(r"CONFIDENCE:\s*([0-9.]+)", text, re.IGNORECASE)
-    if conf_m:
-        try:
-            out["confidence"] = max(0.0, min(1.0, float(conf_m.group(1))))
-        except ValueError:
-            pass
+    sections: dict[str, list[str]] = {}
+    current: str | None = None
+    for line in text.splitlines():
+        hit = _match_label(line)
+        if hit:
+            label, value = hit
+            current = label if label not in sections else None
+            if current:
+                sections[current] = [value]
+        elif current:
+            sections[current].append(line)
+
+    for label, lines in sections.items():
+        key = _RESPONSE_LABELS[label]
+        val = "\n".join(lines).strip()
+        if key == "confidence":
+            conf = _leading_float(val)
+            if conf is not None:
+                out["confidence"] = max(0.0, min(1.0, conf))
+        elif key:
+            out[key] = val
     return out
 
 
-def recommender_agent(state: AgentState) -> AgentState:
+def _as_text(value: Any) -> str:
+    """Coerce a JSON field to display text (models sometimes return lists of steps)."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return "\n".join(str(v).strip() for v in value if str(v).strip())
+    return str(value).strip()
+
+
+def _parse_llm_json(text: str) -> dict[str, Any]:
     """
-    Synthesis agent: call Ollama with cluster-grounded prompt, parse response.
-    Handles timeout (60s) and parse failures; never raises.
+    Parse the recommender's JSON object into root_cause, recommendation, prevention_advice,
+    confidence.
+    Falls back to the labelled-text parser if the model did not return a JSON object.
     """
-    errors = list(state.get("errors") or [])
-    root_cause = ""
-    recommendation = ""
-    prevention_advice = ""
-    confidence = 0.0
-    sources: list[str] = []
+    try:
+        data = json.loads(text) if text else None
+    except json.JSONDecodeError:
+        data = None
+    if not isinstance(data, dict):
+        return _parse_llm_response(text)
+
+    confidence = data.get("confidence")
+    if isinstance(confidence, str):
+        confidence = _leading_float(confidence)
+    try:
+        confidence = max(0.0, min(1.0, float(confidence)))
+    except (TypeError, ValueError):
+        confidence = 0.0
+    return {
+        "root_cause": _as_text(data.get("root_cause")),
+        "recommendation": _as_text(data.get("recommendation")),
+        "prevention_advice": _as_text(data.get("prevention")),
+        "confidence": confidence,
+    }
+
 
+def _finish_recommendation(
+    state: AgentState,
+    content: str | None,
+    errors: list[str],
+) -> AgentState:
+    """Write recommender output to state from the LLM content (None means the LLM call failed)."""
+    sources: list[str] = []
     similar = state.get("similar_incidents") or []
     for s in similar:
-        inc_id = (s.get("metadata") or {}).get("incident_id")
+        inc_id = s["incident_id"]
         if inc_id is not None:
             sources.append(str(inc_id))
 
+    if content is None:
+        parsed: dict[str, Any] = {
+            "recommendation": "Analysis unavailable (LLM error or timeout).",
+            "root_cause": "Could not determine (pipeline error).",
+        }
+    else:
+        parsed = _parse_llm_json(content)
+
+    state["root_cause"] = parsed.get("root_cause", "")
+    state["recommendation"] = parsed.get("recommendation", "")
+    state["prevention_advice"] = parsed.get("prevention_advice", "")
+    state["confidence"] = parsed.get("confidence", 0.0)
+    state["sources"] = sources
+    state["errors"] = errors
+    return state
+
+
+def recommender_agent(state: AgentState) -> AgentState:
+    """
+    Synthesis agent: call Ollama with cluster-grounded prompt, parse response.
+    Handles timeout (60s) and parse failures; never raises.
+    """
+    errors = list(state.get("errors") or [])
+    content: str | None = None
+
+    ollama_url = os.environ.get("OLLAMA_BASE_URL") or "http://localhost:11434"
     try:
-        ollama_url = os.environ.get("OLLAMA_BASE_URL") or "http://localhost:11434"
-        model = get_working_chat_model(base_url=ollama_url)
-        if not model:
+        llm = _get_llm(ollama_url, timeout=60, json_output=True)
+        if llm is None:
             raise RuntimeError(
                 "No Ollama chat model available. Pull a model, e.g.: ollama pull qwen2.5:0.5b"
             )
-        llm = ChatOllama(model=model, base_url=ollama_url, timeout=60)
         prompt = _build_prompt(state)
-        response = llm.invoke(prompt)
-        content = getattr(response, "content", None) or str(response)
-        parsed = _parse_llm_response(content)
-        root_cause = parsed.get("root_cause", "")
-        recommendation = parsed.get("recommendation", "")
-        prevention_advice = parsed.get("prevention_advice", "")
-        confidence = parsed.get("confidence", 0.0)
+        content = _invoke_llm(llm, prompt)
     except Exception as e:
         logger.exception("recommender_agent failed: %s", e)
         errors.append(f"Recommender: {e!s}")
-        recommendation = "Analysis unavailable (LLM error or timeout)."
-        root_cause = "Could not determine (pipeline error)."
+        invalidate_ollama_models(ollama_url)
 
-    state["root_cause"] = root_cause
-    state["recommendation"] = recommendation
-    state["prevention_advice"] = prevention_advice
-    state["confidence"] = confidence
-    state["sources"] = sources
-    state["errors"] = errors
-    return state
+    return _finish_recommendation(state, content, errors)
+
+
+def stream_recommender_agent(state: AgentState) -> Iterator[str]:
+    """
+    Streaming variant of recommender_agent: yields content chunks as Ollama generates them,
+    then fills the same recommender fields on state once the stream is exhausted.
+    Never raises; failures are recorded in state["errors"].
+    """
+    errors = list(state.get("errors") or [])
+    content: str | None = None
+
+    ollama_url = os.environ.get("OLLAMA_BASE_URL") or "http://localhost:11434"
+    try:
+        llm = _get_llm(ollama_url, timeout=60, json_output=True)
+        if llm is None:
+            raise RuntimeError(
+                "No Ollama chat model available. Pull a model, e.g.: ollama pull qwen2.5:0.5b"
+            )
+        prompt = _build_prompt(state)
+        parts: list[str] = []
+        with _ollama_slots:
+            for chunk in llm.stream(prompt):
+                text = getattr(chunk, "content", None) or ""
+                if text:
+                    parts.append(text)
+                    yield text
+        content = "".join(parts)
+    except Exception as e:
+        logger.exception("stream_recommender_agent failed: %s", e)
+        errors.append(f"Recommender: {e!s}")
+        invalidate_ollama_models(ollama_url)
+
+    _finish_recommendation(state, content, errors)
+
+
+# Generated runbooks keyed by incident signature (see _runbook_key). Repeated incidents in a
+# cluster and namespace share type, pod, root cause and past fixes, so their runbooks are
+# reused instead of regenerated. Backed by Incident.runbook_md/runbook_key so hits survive
+# restarts.
+RUNBOOK_CACHE_SIZE = 256
+_runbook_cache: OrderedDict[str, str] = OrderedDict()
+_runbook_cache_lock = threading.Lock()
+
+
+def _runbook_key(
+    incident_type: str,
+    pod_name: str,
+    namespace: str,
+    cluster_id: int | None,
+    root_cause: str,
+    past_fixes: list[dict[str, Any]],
+) -> str:
+    """
+    Stable signature for a runbook's inputs. Scoped to cluster and namespace: the same pod
+    name elsewhere has a different history. Correction documents carry correction_fix_id
+    instead of fix_id.
+    """
+    fix_ids = sorted(
+        str(meta.get("fix_id") or meta.get("correction_fix_id") or "")
+        for meta in ((f.get("metadata") or {}) for f in past_fixes)
+    )
+    raw = f"{cluster_id}|{namespace}|{incident_type}|{pod_name}|{root_cause}|{fix_ids}"
+    return hashlib.blake2b(raw.encode(), digest_size=32).hexdigest()
+
+
+def _cached_runbook(key: str) -> str | None:
+    """Return a previously generated runbook for key from memory, then Postgres."""
+    with _runbook_cache_lock:
+        runbook_md = _runbook_cache.get(key)
+        if runbook_md is not None:
+            _runbook_cache.move_to_end(key)
+            return runbook_md
+    try:
+        from apps.incidents.models import Incident
+
+        runbook_md = (
+            Incident.objects.filter(runbook_key=key)
+            .exclude(runbook_md="")
+            .values_list("runbook_md", flat=True)
+            .first()
+        )
+    except Exception as e:
+        logger.warning("Runbook cache lookup failed: %s", e)
+        return None
+    if runbook_md:
+        _remember_runbook(key, runbook_md)
+    return runbook_md or None
+
+
+def _remember_runbook(key: str, runbook_md: str) -> None:
+    """Store runbook_md in the in-process LRU."""
+    with _runbook_cache_lock:
+        _runbook_cache[key] = runbook_md
+        _runbook_cache.move_to_end(key)
+        while len(_runbook_cache) > RUNBOOK_CACHE_SIZE:
+            _runbook_cache.popitem(last=False)
+
+
+def _persist_runbook(incident_id: int | None, key: str, runbook_md: str) -> None:
+    """Save a generated runbook on its incident so the cache survives restarts."""
+    if incident_id is None:
+        return
+    try:
+        from apps.incidents.models import Incident
+
+        Incident.objects.filter(id=incident_id).update(runbook_md=runbook_md, runbook_key=key)
+    except Exception as e:
+        logger.warning("Could not persist runbook for incident %s: %s", incident_id, e)
 
 
 def runbook_agent(state: AgentState) -> AgentState:
     """
     Generates a reusable runbook in Markdown from the incident analysis.
     Output can be pasted into Confluence, Notion, GitHub.
+    Reuses a cached runbook when the incident signature was already seen.
     """
     runbook_md = ""
     incident_type = state.get("incident_type", "Unknown")
@@ -360,12 +742,30 @@ def runbook_agent(state: AgentState) -> AgentState:
     blast_radius = state.get("blast_radius") or []
     recommendation = state.get("recommendation", "")
 
-    past_fixes_text = "\n".join(
-        [f"- {f.get('content', '')[:300]}" for f in past_fixes[:5]]
-    ) if past_fixes else "No fixes recorded yet."
-    blast_text = ", ".join(
-        [f"{b.get('affected_pod', '')} ({b.get('co_occurrence', 0)}x)" for b in blast_radius[:5]]
-    ) if blast_radius else "None identified."
+    key = _runbook_key(
+        incident_type,
+        pod_name,
+        state.get("namespace", ""),
+        state.get("cluster_id"),
+        root_cause,
+        past_fixes,
+    )
+    cached = _cached_runbook(key)
+    if cached is not None:
+        state["runbook_md"] = cached
+        return state
+
+    budget = PROMPT_CONTEXT_BUDGET
+    past_fixes_lines, budget = _take_within_budget(
+        [f"- {f['content_excerpt']}" for f in _rank_context(past_fixes)[:5]],
+        budget,
+    )
+    past_fixes_text = "\n".join(past_fixes_lines) if past_fixes_lines else "No fixes recorded yet."
+    blast_parts, budget = _take_within_budget(
+        [f"{b.get('affected_pod', '')} ({b.get('co_occurrence', 0)}x)" for b in blast_radius[:5]],
+        budget,
+    )
+    blast_text = ", ".join(blast_parts) if blast_parts else "None identified."
 
     prompt = f"""Generate a production runbook for this incident type.
 Base it on this cluster's actual history, not generic advice.
@@ -406,17 +806,19 @@ Write the runbook in this EXACT Markdown format:
 ---
 *Auto-generated by KubeMemory from cluster history*
 """
+    ollama_url = os.environ.get("OLLAMA_BASE_URL") or "http://localhost:11434"
     try:
-        ollama_url = os.environ.get("OLLAMA_BASE_URL") or "http://localhost:11434"
-        model = get_working_chat_model(base_url=ollama_url)
-        if model:
-            llm = ChatOllama(model=model, base_url=ollama_url, timeout=90)
-            response = llm.invoke(prompt)
-            runbook_md = getattr(response, "content", None) or str(response) or ""
+        llm = _get_llm(ollama_url, timeout=90)
+        if llm is not None:
+            runbook_md = _invoke_llm(llm, prompt) or ""
+            if runbook_md:
+                _remember_runbook(key, runbook_md)
+                _persist_runbook(state.get("incident_id"), key, runbook_md)
         else:
             runbook_md = f"# Runbook: {incident_type} on {service_name}\n\n## Symptoms\n- {root_cause or 'See incident description.'}\n\n## Fix Steps\n{recommendation or 'No recommendation available.'}\n\n---\n*Runbook stub (Ollama not available for full generation)*"
     except Exception as e:
         logger.exception("runbook_agent failed: %s", e)
+        invalidate_ollama_models(ollama_url)
         runbook_md = f"# Runbook: {incident_type} on {service_name}\n\n## Error\nRunbook generation failed: {e}\n\n## Recommendation from analysis\n{recommendation or 'N/A'}"
     state["runbook_md"] = runbook_md
     return state
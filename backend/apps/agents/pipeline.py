@@ -3,27 +3,53 @@ LangGraph pipeline orchestration.
 Wires the three agents into a compiled graph.
 """
 import time
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Iterator
 
 from langgraph.graph import END, StateGraph
 
-from .agents import correlator_agent, recommender_agent, retriever_agent
+from .agents import correlator_agent, recommender_agent, retriever_agent, stream_recommender_agent
 from .state import AgentState
 
 _pipeline: Any = None
 
+# State keys owned by each context agent; they never overlap, so merging is a dict update.
+_RETRIEVER_KEYS = ("similar_incidents", "past_fixes", "corrections")
+_CORRELATOR_KEYS = ("causal_patterns", "blast_radius", "deploy_correlation")
+
+
+def gather_context(state: AgentState) -> AgentState:
+    """
+    Run retriever (ChromaDB) and correlator (Neo4j) concurrently and merge their output.
+    They touch disjoint stores and state keys, so latency is max(retrieve, correlate).
+    Both agents never raise; errors from each are appended after the incoming ones.
+    """
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        retrieved_future = ex.submit(retriever_agent, dict(state))
+        correlated_future = ex.submit(correlator_agent, dict(state))
+        retrieved = retrieved_future.result()
+        correlated = correlated_future.result()
+
+    errors = list(state.get("errors") or [])
+    seen = len(errors)
+    for key in _RETRIEVER_KEYS:
+        state[key] = retrieved[key]
+    for key in _CORRELATOR_KEYS:
+        state[key] = correlated[key]
+    state["errors"] = errors + retrieved["errors"][seen:] + correlated["errors"][seen:]
+    return state
+
 
 def build_pipeline() -> Any:
     """Build and compile the LangGraph pipeline."""
     graph = StateGraph(AgentState)
 
-    graph.add_node("retrieve", retriever_agent)
-    graph.add_node("correlate", correlator_agent)
+    graph.add_node("gather", gather_context)
     graph.add_node("recommend", recommender_agent)
 
-    graph.set_entry_point("retrieve")
-    graph.add_edge("retrieve", "correlate")
-    graph.add_edge("correlate", "recommend")
+    graph.set_entry_point("gather")
+    graph.add_edge("gather", "recommend")
     graph.add_edge("recommend", END)
 
     return graph.compile()
@@ -37,6 +63,30 @@ def get_pipeline() -> Any:
     return _pipeline
 
 
+# Only the columns the agents read; raw_logs is fetched as a 500-char excerpt computed in SQL.
+_ANALYSIS_FIELDS = (
+    "id",
+    "incident_type",
+    "pod_name",
+    "namespace",
+    "description",
+    "severity",
+    "cluster_id",
+)
+RAW_LOGS_EXCERPT_CHARS = 500
+
+
+def _incidents_for_analysis() -> Any:
+    """Incident queryset trimmed to what the pipeline needs (plus raw_logs_excerpt)."""
+    from django.db.models.functions import Substr
+
+    from apps.incidents.models import Incident
+
+    return Incident.objects.only(*_ANALYSIS_FIELDS).annotate(
+        raw_logs_excerpt=Substr("raw_logs", 1, RAW_LOGS_EXCERPT_CHARS),
+    )
+
+
 def analyze_incident(incident_id: int) -> dict[str, Any]:
     """
     Main entry point. Loads incident from DB, runs full pipeline,
@@ -45,15 +95,11 @@ def analyze_incident(incident_id: int) -> dict[str, Any]:
     from apps.incidents.models import Incident
 
     try:
-        incident = Incident.objects.get(id=incident_id)
+        incident = _incidents_for_analysis().get(id=incident_id)
     except Incident.DoesNotExist:
         raise ValueError(f"Incident id={incident_id} not found")
 
-    initial_state = _state_from_incident(incident_id, incident)
-    start = time.time()
-    pipeline = get_pipeline()
-    final_state = pipeline.invoke(initial_state)
-    final_state["processing_time_ms"] = int((time.time() - start) * 1000)
+    final_state = _run_pipeline(_state_from_incident(incident_id, incident))
 
     # Save analysis back to Postgres
     incident.ai_analysis = final_state.get("recommendation", "")
@@ -62,48 +108,126 @@ def analyze_incident(incident_id: int) -> dict[str, Any]:
     return final_state
 
 
+def stream_analyze_incident(incident_id: int) -> Iterator[dict[str, Any]]:
+    """
+    Same work as analyze_incident, but yields SSE-ready events so the UI can render the
+    recommendation while it is generated:
+      {"type": "token", "content": "..."} per LLM chunk
+      {"type": "done", "incident_id": ..., "root_cause": ..., "recommendation": ...,
+       "confidence": ..., "processing_time_ms": ...}
+    Raises ValueError before the first event if the incident does not exist.
+    """
+    from apps.incidents.models import Incident
+
+    try:
+        incident = _incidents_for_analysis().get(id=incident_id)
+    except Incident.DoesNotExist:
+        raise ValueError(f"Incident id={incident_id} not found")
+
+    def events() -> Iterator[dict[str, Any]]:
+        state = _state_from_incident(incident_id, incident)
+        start = time.time()
+        state = gather_context(state)
+        for text in stream_recommender_agent(state):
+            yield {"type": "token", "content": text}
+        state["processing_time_ms"] = int((time.time() - start) * 1000)
+
+        incident.ai_analysis = state.get("recommendation", "")
+        incident.save(update_fields=["ai_analysis"])
+
+        yield {
+            "type": "done",
+            "incident_id": incident_id,
+            "root_cause": state.get("root_cause", ""),
+            "recommendation": state.get("recommendation", ""),
+            "confidence": state.get("confidence", 0.0),
+            "processing_time_ms": state["processing_time_ms"],
+        }
+
+    return events()
+
+
+def _run_pipeline(initial_state: AgentState) -> dict[str, Any]:
+    """Invoke the compiled pipeline on an initial state and stamp processing_time_ms."""
+    start = time.time()
+    final_state = get_pipeline().invoke(initial_state)
+    final_state["processing_time_ms"] = int((time.time() - start) * 1000)
+    return final_state
+
+
+def analyze_incidents(incident_ids: list[int], max_concurrency: int = 8) -> list[dict[str, Any]]:
+    """
+    Batch entry point for reprocessing/backfill: analyze many incidents with one DB read,
+    up to max_concurrency pipelines in flight, and one bulk UPDATE for ai_analysis.
+    Ids that do not exist are skipped. Returns final states in input order.
+    """
+    from apps.incidents.models import Incident
+
+    by_id = _incidents_for_analysis().in_bulk(list(dict.fromkeys(incident_ids)))
+    incidents = [by_id[i] for i in dict.fromkeys(incident_ids) if i in by_id]
+    if not incidents:
+        return []
+
+    states = [_state_from_incident(incident.id, incident) for incident in incidents]
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(states)))) as ex:
+        final_states = list(ex.map(_run_pipeline, states))
+
+    for incident, final_state in zip(incidents, final_states):
+        incident.ai_analysis = final_state.get("recommendation", "")
+    Incident.objects.bulk_update(incidents, ["ai_analysis"])
+
+    return final_states
+
+
+# Output/context fields every fresh AgentState starts with. Scalars are shared; list fields
+# are listed separately so each state gets its own empty list.
+_EMPTY_STATE_DEFAULTS: MappingProxyType = MappingProxyType({
+    "deploy_correlation": None,
+    "recommendation": "",
+    "root_cause": "",
+    "confidence": 0.0,
+    "prevention_advice": "",
+    "processing_time_ms": 0,
+})
+_EMPTY_STATE_LISTS = (
+    "similar_incidents",
+    "past_fixes",
+    "corrections",
+    "causal_patterns",
+    "blast_radius",
+    "sources",
+    "errors",
+)
+
+
 def _state_from_incident(
     incident_id: int | None,
     incident: Any,
 ) -> AgentState:
     """Build initial AgentState from an incident-like object (model or dict)."""
-    if hasattr(incident, "incident_type"):
-        it = incident.incident_type or ""
-        pn = incident.pod_name or ""
-        ns = incident.namespace or ""
-        desc = incident.description or ""
-        raw = (getattr(incident, "raw_logs", None) or "")[:500]
-        sev = incident.severity or ""
-    else:
-        it = incident.get("incident_type", "")
-        pn = incident.get("pod_name", "")
-        ns = incident.get("namespace", "")
-        desc = incident.get("description", "")
-        raw = (incident.get("raw_logs") or "")[:500]
-        sev = incident.get("severity", "medium")
-
-    return {
-        "incident_id": incident_id,
-        "incident_type": it,
-        "pod_name": pn,
-        "namespace": ns,
-        "description": desc,
-        "raw_logs": raw,
-        "severity": sev,
-        "similar_incidents": [],
-        "past_fixes": [],
-        "corrections": [],
-        "causal_patterns": [],
-        "blast_radius": [],
-        "deploy_correlation": None,
-        "recommendation": "",
-        "root_cause": "",
-        "confidence": 0.0,
-        "sources": [],
-        "prevention_advice": "",
-        "errors": [],
-        "processing_time_ms": 0,
-    }
+    is_mapping = isinstance(incident, dict)
+
+    def field(name: str, default: str = "") -> str:
+        value = incident.get(name) if is_mapping else getattr(incident, name, None)
+        return value or default
+
+    state: dict[str, Any] = dict(_EMPTY_STATE_DEFAULTS)
+    for key in _EMPTY_STATE_LISTS:
+        state[key] = []
+    state["incident_id"] = incident_id
+    state["incident_type"] = field("incident_type")
+    state["pod_name"] = field("pod_name")
+    state["namespace"] = field("namespace")
+    state["description"] = field("description")
+    # Model instances from _incidents_for_analysis carry the SQL-side excerpt instead.
+    raw_field = "raw_logs_excerpt" if hasattr(incident, "raw_logs_excerpt") else "raw_logs"
+    raw_logs = field(raw_field)
+    state["raw_logs"] = raw_logs[:RAW_LOGS_EXCERPT_CHARS]
+    state["severity"] = field("severity", "medium")
+    state["cluster_id"] = (
+        incident.get("cluster_id") if is_mapping else getattr(incident, "cluster_id", None)
+    )
+    return state
 
 
 def analyze_incident_in_memory(
@@ -126,9 +250,4 @@ def analyze_incident_in_memory(
         "raw_logs": logs_excerpt,
         "severity": "medium",
     }
-    initial_state = _state_from_incident(None, incident)
-    start = time.time()
-    pipeline = get_pipeline()
-    final_state = pipeline.invoke(initial_state)
-    final_state["processing_time_ms"] = int((time.time() - start) * 1000)
-    return final_state
+    return _run_pipeline(_state_from_incident(None, incident))
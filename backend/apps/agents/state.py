@@ -16,6 +16,7 @@ class AgentState(TypedDict):
     description: str
     raw_logs: str
     severity: str
+    cluster_id: NotRequired[Optional[int]]  # None for in-memory or unassigned incidents
 
     # RETRIEVER OUTPUT
     similar_incidents: List[dict]
@@ -1,6 +1,19 @@
 """API views for agents: trigger analysis, get analysis, status."""
+import asyncio
+import json
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any
 
+import requests
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count, Q
+from django.http import StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from rest_framework import status
 from rest_framework.decorators import api_view
@@ -19,6 +32,7 @@ def trigger_analyze(request, incident_id: int) -> Response:
     Trigger analysis for an incident.
     By default runs synchronously so the result is available immediately (no Celery).
     Add ?async=1 to queue the task in Celery instead.
+    Add ?stream=1 to receive the recommendation as Server-Sent Events while it is generated.
     """
     if not Incident.objects.filter(id=incident_id).exists():
         return Response(
@@ -29,6 +43,41 @@ def trigger_analyze(request, incident_id: int) -> Response:
     if run_async:
         run_ai_analysis_task.delay(incident_id)
         return Response({"status": "queued", "incident_id": incident_id})
+    if request.query_params.get("stream") in ("1", "true", "yes"):
+        from apps.agents.pipeline import stream_analyze_incident
+
+        async def event_stream():
+            # Async iterator (as in chat/views.py): under ASGI a sync generator would be
+            # drained into a list before the first byte is sent. The sync pipeline runs in
+            # one worker thread and hands each event over through a queue.
+            loop = asyncio.get_running_loop()
+            q: asyncio.Queue = asyncio.Queue()
+
+            def produce() -> None:
+                try:
+                    for event in stream_analyze_incident(incident_id):
+                        loop.call_soon_threadsafe(q.put_nowait, event)
+                except Exception as exc:
+                    logger.exception(
+                        "trigger_analyze stream failed for incident_id=%s", incident_id
+                    )
+                    loop.call_soon_threadsafe(
+                        q.put_nowait, {"type": "error", "message": str(exc)}
+                    )
+                finally:
+                    connection.close()  # opened by this worker thread, not request-managed
+                    loop.call_soon_threadsafe(q.put_nowait, None)
+
+            producer = asyncio.ensure_future(sync_to_async(produce, thread_sensitive=False)())
+            while (event := await q.get()) is not None:
+                yield f"data: {json.dumps(event)}\n\n"
+            await producer
+            yield "data: [STREAM_END]\n\n"
+
+        response = StreamingHttpResponse(event_stream(), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
     # Run synchronously so the UI gets results without depending on Celery
     try:
         from apps.agents.pipeline import analyze_incident
@@ -53,13 +102,13 @@ def get_analysis(request, incident_id: int) -> Response:
     Includes recommendation, root_cause, confidence, sources, prevention_advice.
     If no analysis yet: {status: "pending"}.
     """
-    incident = Incident.objects.filter(id=incident_id).first()
+    incident = Incident.objects.filter(id=incident_id).only("id", "ai_analysis").first()
     if not incident:
         return Response(
             {"error": "Incident not found."},
             status=status.HTTP_404_NOT_FOUND,
         )
-    if not (incident.ai_analysis or incident.ai_analysis.strip()):
+    if not (incident.ai_analysis and incident.ai_analysis.strip()):
         return Response({"status": "pending"})
     return Response({
         "status": "ok",
@@ -71,45 +120,89 @@ def get_analysis(request, incident_id: int) -> Response:
     })
 
 
+# Dashboard health polling: probes run in parallel and the combined answer is cached briefly.
+PIPELINE_STATUS_CACHE_SECONDS = 15
+PIPELINE_STATUS_PROBE_TIMEOUT = 5.0
+_status_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pipeline-status")
+_status_session = requests.Session()
+
+
+@lru_cache(maxsize=4)
+def _chroma_collection(persist_dir: str, collection_name: str) -> Any:
+    """Open (once per process) the Chroma collection used for status counts."""
+    import chromadb
+
+    client = chromadb.PersistentClient(path=persist_dir)
+    return client.get_or_create_collection(name=collection_name)
+
+
+# Last document count per (persist_dir, collection_name): {key: (counted_at_monotonic, count)}.
+CHROMA_COUNT_CACHE_SECONDS = 10.0
+_chroma_count_cache: dict[tuple[str, str], tuple[float, int]] = {}
+
+
+def _probe_chroma() -> int | None:
+    """
+    Return the ChromaDB incident collection's document count
+    (cached CHROMA_COUNT_CACHE_SECONDS).
+    """
+    persist_dir = os.environ.get("CHROMA_PERSIST_DIR") or "/app/chroma_data"
+    collection_name = os.environ.get("CHROMA_COLLECTION_NAME") or "kubememory_incidents"
+    key = (persist_dir, collection_name)
+    cached = _chroma_count_cache.get(key)
+    if cached and time.monotonic() - cached[0] < CHROMA_COUNT_CACHE_SECONDS:
+        return cached[1]
+    try:
+        count = _chroma_collection(persist_dir, collection_name).count()
+    except Exception:
+        # Handle may be stale (e.g. collection recreated by clear_all); reopen next time.
+        _chroma_collection.cache_clear()
+        raise
+    _chroma_count_cache[key] = (time.monotonic(), count)
+    return count
+
+
+def _probe_ollama(ollama_url: str) -> bool:
+    """Return True if the Ollama server answers /api/version (1 RTT, no model load)."""
+    _status_session.get(f"{ollama_url.rstrip('/')}/api/version", timeout=3).raise_for_status()
+    return True
+
+
 @api_view(["GET"])
 def pipeline_status(request) -> Response:
     """
     Pipeline status: LLM model, Ollama connectivity, ChromaDB doc count.
-    For dashboard health panel.
+    For dashboard health panel. Cached for PIPELINE_STATUS_CACHE_SECONDS.
     """
-    import os
-
     model = os.environ.get("OLLAMA_CHAT_MODEL") or "mistral:7b"
     ollama_url = os.environ.get("OLLAMA_BASE_URL") or "http://localhost:11434"
+    cache_key = f"pipeline_status:{model}:{ollama_url}"
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return Response(cached)
+
+    chroma_future = _status_executor.submit(_probe_chroma)
+    ollama_future = _status_executor.submit(_probe_ollama, ollama_url)
+
     chroma_count: int | None = None
     ollama_ok = False
-
     try:
-        import chromadb
-
-        persist_dir = os.environ.get("CHROMA_PERSIST_DIR") or "/app/chroma_data"
-        collection_name = os.environ.get("CHROMA_COLLECTION_NAME") or "kubememory_incidents"
-        client = chromadb.PersistentClient(path=persist_dir)
-        coll = client.get_or_create_collection(name=collection_name)
-        chroma_count = coll.count()
+        chroma_count = chroma_future.result(timeout=PIPELINE_STATUS_PROBE_TIMEOUT)
     except Exception:
         pass
-
     try:
-        from langchain_ollama import ChatOllama
-
-        llm = ChatOllama(model=model, base_url=ollama_url, timeout=5)
-        llm.invoke("Hi")
-        ollama_ok = True
+        ollama_ok = ollama_future.result(timeout=PIPELINE_STATUS_PROBE_TIMEOUT)
     except Exception:
         pass
 
-    return Response({
+    payload = {
         "model": model,
         "ollama_base_url": ollama_url,
         "ollama_ok": ollama_ok,
         "chroma_doc_count": chroma_count,
-    })
+    }
+    cache.set(cache_key, payload, timeout=PIPELINE_STATUS_CACHE_SECONDS)
+    return Response(payload)
 
 
 @api_view(["POST"])
@@ -139,6 +232,11 @@ def generate_runbook(request, incident_id: int) -> Response:
         )
 
 
+# Per-query wait in compute_risk_check; a stalled query yields empty results, not a hung request.
+RISK_CHECK_QUERY_TIMEOUT = 5.0
+_risk_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="risk-check")
+
+
 def compute_risk_check(service_name: str, namespace: str) -> dict:
     """
     Pre-deploy risk assessment. Returns risk_level, risk_score, open_incidents,
@@ -146,27 +244,35 @@ def compute_risk_check(service_name: str, namespace: str) -> dict:
     Used by both the risk_check API view and the chat/MCP risk_check tool.
     """
     from apps.incidents.models import Incident
-    from apps.memory.graph_builder import KubeGraphBuilder
+    from apps.memory.graph_builder import get_shared_graph
 
-    open_incidents = list(
-        Incident.objects.filter(
-            service_name=service_name,
-            namespace=namespace,
-            status__in=["open", "investigating"],
-        )
+    counts = Incident.objects.filter(
+        service_name=service_name,
+        namespace=namespace,
+        status__in=["open", "investigating"],
+    ).aggregate(
+        total=Count("id"),
+        critical=Count("id", filter=Q(severity="critical")),
+        high=Count("id", filter=Q(severity="high")),
     )
-    critical_count = sum(1 for i in open_incidents if i.severity == "critical")
-    high_count = sum(1 for i in open_incidents if i.severity == "high")
+    critical_count = counts["critical"]
+    high_count = counts["high"]
 
     blast: list = []
     deploy_history: list = []
     try:
-        graph = KubeGraphBuilder()
+        # Independent graph queries: run both at once on the shared (thread-safe) driver.
+        graph = get_shared_graph()
+        blast_future = _risk_executor.submit(graph.find_blast_radius, service_name, namespace)
+        history_future = _risk_executor.submit(graph.find_deploy_to_crash_correlation)
+        try:
+            blast = blast_future.result(timeout=RISK_CHECK_QUERY_TIMEOUT)
+        except Exception as e:
+            logger.exception("risk_check blast radius query failed: %s", e)
         try:
-            blast = graph.find_blast_radius(service_name, namespace)
-            deploy_history = graph.find_deploy_to_crash_correlation()
-        finally:
-            graph.close()
+            deploy_history = history_future.result(timeout=RISK_CHECK_QUERY_TIMEOUT)
+        except Exception as e:
+            logger.exception("risk_check deploy history query failed: %s", e)
     except Exception as e:
         logger.exception("risk_check graph failed: %s", e)
     deploy_history = [d for d in deploy_history if d.get("service") == service_name][:3]
@@ -183,7 +289,7 @@ def compute_risk_check(service_name: str, namespace: str) -> dict:
     return {
         "risk_level": risk_level,
         "risk_score": risk_score,
-        "open_incidents": len(open_incidents),
+        "open_incidents": counts["total"],
         "blast_radius_unstable": blast_unstable,
         "deploy_crash_history": deploy_history,
         "recommendation": recommendation,
@@ -0,0 +1,28 @@
+"""
+Startup warm-up for the agents pipeline. Called only by the processes that serve analyses:
+the web server (config/asgi.py, config/wsgi.py) and each Celery pool child
+(worker_process_init) — never from AppConfig.ready(), which also runs for every manage.py
+command and in the Celery prefork parent, whose open Chroma handles and half-started
+threads would be inherited by forked children.
+"""
+import os
+import threading
+
+
+def start_warmup() -> None:
+    """
+    Compile the LangGraph pipeline now and warm its backends in a daemon thread so the first
+    analysis doesn't pay for them. The chat model is loaded into Ollama only if
+    OLLAMA_PREWARM=True.
+    """
+    from . import pipeline
+    from .agents import prewarm_chat_model, prewarm_vector_store
+
+    pipeline.get_pipeline()
+
+    def warm() -> None:
+        prewarm_vector_store()
+        if (os.environ.get("OLLAMA_PREWARM") or "").lower() in ("1", "true", "yes"):
+            prewarm_chat_model()
+
+    threading.Thread(target=warm, name="agents-prewarm", daemon=True).start()
@@ -17,8 +17,10 @@ class ChatMessageAdmin(admin.ModelAdmin):
     list_filter = ["role"]
     search_fields = ["content"]
     ordering = ["created_at"]
+    list_select_related = ["session"]
 
     def content_preview(self, obj):
-        return (obj.content or "")[:60] + ("..." if len(obj.content or "") > 60 else "")
+        content = obj.content or ""
+        return content[:60] + ("..." if len(content) > 60 else "")
 
     content_preview.short_description = "Content"
@@ -2,16 +2,77 @@
 Cluster chat agent: Ollama + MCP tools loop with streaming.
 Production-grade, modular: tools come from apps.mcp_server.tools.
 """
+import asyncio
 import json
 import logging
 import os
-from typing import Any, Callable
+import re
+import time
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Mapping
 
-from apps.agents.agents import get_working_chat_model
-from apps.mcp_server.tools import execute_tool, get_ollama_tools
+import httpx
+import orjson
+
+from apps.agents.agents import OLLAMA_KEEP_ALIVE, get_working_chat_model
+from apps.mcp_server.tools import aexecute_tool, get_ollama_tools
 
 logger = logging.getLogger(__name__)
 
+StreamCallback = Callable[[str, dict], Awaitable[None]]
+
+# Process-wide async HTTP client (created in ChatConfig.ready()) so every tool round and
+# every chat message reuses keep-alive connections to Ollama without a worker thread.
+_CLIENT: httpx.AsyncClient | None = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared httpx.AsyncClient used for Ollama chat, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=32),
+            timeout=httpx.Timeout(120.0, connect=10.0),
+        )
+    return _CLIENT
+
+
+# Cluster-history keywords that trigger the search_incident_history fallback. Matched as
+# word prefixes (no trailing \b) so "incidents", "crashed", "pods" still count.
+_FALLBACK_RE = re.compile(
+    r"\b(?:incident|history|crash|pattern|what|show|recent|oom|error|fail|cluster|namespace|pod)",
+    re.IGNORECASE,
+)
+
+# Shared read-only stand-in for a tool call without a "function" entry.
+_EMPTY_FUNCTION: Mapping[str, Any] = MappingProxyType({})
+
+# Tool schemas are static: serialize them once and splice the bytes into every /api/chat body.
+_TOOLS_JSON = orjson.dumps(get_ollama_tools())
+
+# Chat model resolved per Ollama base URL: {base_url: (model, resolved_at_monotonic)}.
+# Only the first message pays the probe; a model pulled/removed later is picked up after
+# the TTL, on an Ollama error, or on process restart.
+RESOLVED_MODEL_TTL = 600.0
+_resolved_models: dict[str, tuple[str, float]] = {}
+
+
+def _resolved_model(base_url: str) -> str | None:
+    """Return the working chat model for base_url, memoized for RESOLVED_MODEL_TTL seconds."""
+    cached = _resolved_models.get(base_url)
+    if cached and time.monotonic() - cached[1] < RESOLVED_MODEL_TTL:
+        return cached[0]
+    model = get_working_chat_model(base_url=base_url)
+    if model:
+        _resolved_models[base_url] = (model, time.monotonic())
+    return model
+
+
+def _forget_resolved_model(base_url: str) -> None:
+    """Drop the memoized model so the next message re-probes Ollama."""
+    _resolved_models.pop(base_url, None)
+
+
 SYSTEM_PROMPT = """You are the KubeMemory cluster assistant. You have access to this Kubernetes cluster's incident memory via tools.
 
 **When to use each tool:**
@@ -24,83 +85,124 @@ SYSTEM_PROMPT = """You are the KubeMemory cluster assistant. You have access to
 **Rules:** For general questions like "show incidents" or "what's in the cluster", use search_incident_history with the user's message as the query. Never call get_pod_history without a specific pod name. If a tool returns "No ... found", say so and suggest: run `make seed` to add sample data, or narrow the query (e.g. a namespace or pod name). Answer concisely; summarize tool results for the user."""
 
 
-def _ollama_chat_stream(
+# Minimum streamed characters per "chunk" event; fast models otherwise emit a frame per token.
+CHUNK_FLUSH_CHARS = 64
+
+
+async def _ollama_chat_stream(
     base_url: str,
     model: str,
     messages: list[dict[str, Any]],
-    tools: list[dict],
-    stream_callback: Callable[[str, dict], None],
+    tools_json: bytes,
+    stream_callback: StreamCallback,
 ) -> tuple[str, str, list[dict]]:
     """
-    Call Ollama /api/chat with stream=True. Invoke stream_callback("chunk", {"content": "..."}) for each content delta.
+    Call Ollama /api/chat with stream=True. Await stream_callback("chunk", {"content": "..."})
+    with content deltas coalesced to at least CHUNK_FLUSH_CHARS (one websocket frame per batch,
+    not per token).
+    tools_json is the pre-serialized tools array (see _TOOLS_JSON).
     Returns (accumulated_content, accumulated_thinking, tool_calls_list).
     """
-    import urllib.request
-    import urllib.error
-
     body = {
         "model": model,
         "messages": messages,
-        "tools": tools,
         "stream": True,
+        "keep_alive": OLLAMA_KEEP_ALIVE,
     }
-    req = urllib.request.Request(
-        f"{base_url.rstrip('/')}/api/chat",
-        data=json.dumps(body).encode("utf-8"),
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
+    payload = orjson.dumps(body)[:-1] + b',"tools":' + tools_json + b"}"
     content_acc = ""
     thinking_acc = ""
     tool_calls_acc: list[dict] = []
-    buffer = ""
+    pending: list[str] = []
+    pending_len = 0
+
+    async def flush() -> None:
+        nonlocal pending_len
+        if pending:
+            await stream_callback("chunk", {"content": "".join(pending)})
+            pending.clear()
+            pending_len = 0
+
     try:
-        with urllib.request.urlopen(req, timeout=120) as resp:
-            while True:
-                chunk_bytes = resp.read(1024)
-                if not chunk_bytes:
-                    break
-                buffer += chunk_bytes.decode("utf-8", errors="replace")
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        parsed = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    msg = parsed.get("message") or {}
-                    if msg.get("content"):
-                        content_acc += msg["content"]
-                        stream_callback("chunk", {"content": msg["content"]})
-                    if msg.get("thinking"):
-                        thinking_acc += msg.get("thinking", "")
-                    if msg.get("tool_calls"):
-                        for tc in msg["tool_calls"]:
-                            tool_calls_acc.append(tc)
-                    if parsed.get("done"):
-                        return content_acc, thinking_acc, tool_calls_acc
-    except urllib.error.HTTPError as e:
-        err_body = e.read().decode("utf-8") if e.fp else str(e)
-        logger.exception("Ollama chat request failed: %s %s", e.code, err_body)
-        stream_callback("error", {"message": f"Ollama error: {e.code} {err_body}"})
+        async with get_async_client().stream(
+            "POST",
+            f"{base_url.rstrip('/')}/api/chat",
+            content=payload,
+            headers={"Content-Type": "application/json"},
+        ) as resp:
+            if resp.is_error:
+                err_body = (await resp.aread()).decode("utf-8", errors="replace")
+                logger.error("Ollama chat request failed: %s %s", resp.status_code, err_body)
+                _forget_resolved_model(base_url)
+                await stream_callback(
+                    "error", {"message": f"Ollama error: {resp.status_code} {err_body}"}
+                )
+                return content_acc, thinking_acc, tool_calls_acc
+            async for line in resp.aiter_lines():
+                if not line:
+                    continue
+                try:
+                    parsed = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                msg = parsed.get("message") or {}
+                if msg.get("content"):
+                    content_acc += msg["content"]
+                    pending.append(msg["content"])
+                    pending_len += len(msg["content"])
+                    if pending_len >= CHUNK_FLUSH_CHARS:
+                        await flush()
+                if msg.get("thinking"):
+                    thinking_acc += msg.get("thinking", "")
+                if msg.get("tool_calls"):
+                    for tc in msg["tool_calls"]:
+                        tool_calls_acc.append(tc)
+                if parsed.get("done"):
+                    await flush()
+                    return content_acc, thinking_acc, tool_calls_acc
+        await flush()
     except Exception as e:
         logger.exception("Ollama stream failed: %s", e)
-        stream_callback("error", {"message": str(e)})
+        _forget_resolved_model(base_url)
+        await flush()
+        await stream_callback("error", {"message": str(e)})
     return content_acc, thinking_acc, tool_calls_acc
 
 
-def run_chat_agent(
+# Conversation history sent to Ollama: most recent messages only, within a char budget
+# (a proxy for prompt tokens, which dominate Ollama latency and KV-cache use).
+HISTORY_MAX_MESSAGES = 10
+HISTORY_MAX_CHARS = 12000
+
+
+def _trim_history(
+    history: list[dict[str, str]],
+    max_messages: int = HISTORY_MAX_MESSAGES,
+    max_chars: int = HISTORY_MAX_CHARS,
+) -> list[dict[str, str]]:
+    """Return the newest history items (oldest first) that fit max_messages and max_chars."""
+    kept: list[dict[str, str]] = []
+    budget = max_chars
+    for h in reversed(history[-max_messages:]):
+        size = len(h.get("content") or "")
+        if size > budget:
+            break
+        kept.append(h)
+        budget -= size
+    kept.reverse()
+    return kept
+
+
+async def run_chat_agent(
     user_message: str,
     history: list[dict[str, str]] | None = None,
-    stream_callback: Callable[[str, dict], None] | None = None,
+    stream_callback: StreamCallback | None = None,
     cluster_id: int | None = None,
     cluster_name: str | None = None,
 ) -> str:
     """
     Run the agent loop: user message + optional history, Ollama with tools, execute tool_calls, repeat until done.
-    stream_callback(event_type, data) is called with:
+    stream_callback(event_type, data) is awaited with:
       - "chunk", {"content": "..."} for each content delta
       - "tool_call", {"name": "...", "arguments": {...}, "result": "..."}
       - "done", {}
@@ -108,24 +210,23 @@ def run_chat_agent(
     Returns the full assistant reply (accumulated content).
     """
     base_url = os.environ.get("OLLAMA_BASE_URL") or "http://localhost:11434"
-    model = get_working_chat_model(base_url=base_url)
+    model = await asyncio.to_thread(_resolved_model, base_url)
     if not model:
         err = "No Ollama chat model available. Pull a model, e.g.: ollama pull qwen2.5:0.5b"
         if stream_callback:
-            stream_callback("error", {"message": err})
+            await stream_callback("error", {"message": err})
         return err
 
-    tools = get_ollama_tools()
     system = SYSTEM_PROMPT
     if cluster_name:
         system += f"\n\n**Current cluster:** {cluster_name}. Prefer data and namespaces for this cluster when answering."
     messages: list[dict[str, Any]] = [{"role": "system", "content": system}]
     if history:
-        for h in history:
+        for h in _trim_history(history):
             messages.append({"role": h.get("role", "user"), "content": h.get("content", "") or ""})
     messages.append({"role": "user", "content": user_message})
 
-    def noop(_event: str, _data: dict) -> None:
+    async def noop(_event: str, _data: dict) -> None:
         pass
 
     cb = stream_callback or noop
@@ -135,8 +236,8 @@ def run_chat_agent(
 
     while rounds < max_tool_rounds:
         rounds += 1
-        content, _thinking, tool_calls = _ollama_chat_stream(
-            base_url, model, messages, tools, cb
+        content, _thinking, tool_calls = await _ollama_chat_stream(
+            base_url, model, messages, _TOOLS_JSON, cb
         )
         full_reply = content
 
@@ -149,14 +250,7 @@ def run_chat_agent(
             and user_message.strip()
             and len(user_message.strip()) > 3
         ):
-            query_lower = user_message.lower()
-            if any(
-                w in query_lower
-                for w in (
-                    "incident", "history", "crash", "pattern", "what", "show", "recent",
-                    "oom", "error", "fail", "cluster", "namespace", "pod",
-                )
-            ):
+            if _FALLBACK_RE.search(user_message):
                 tool_calls = [
                     {
                         "function": {
@@ -170,19 +264,19 @@ def run_chat_agent(
         if tool_calls:
             # Build assistant message for Ollama (with tool_calls)
             assistant_msg: dict[str, Any] = {"role": "assistant", "content": content or ""}
+            functions = [tc.get("function") or _EMPTY_FUNCTION for tc in tool_calls]
             assistant_msg["tool_calls"] = [
                 {
                     "type": "function",
                     "function": {
-                        "name": tc.get("function", {}).get("name", ""),
-                        "arguments": tc.get("function", {}).get("arguments") or {},
+                        "name": fn.get("name", ""),
+                        "arguments": fn.get("arguments") or {},
                     },
                 }
-                for tc in tool_calls
+                for fn in functions
             ]
             messages.append(assistant_msg)
-            for tc in tool_calls:
-                fn = tc.get("function") or {}
+            for fn in functions:
                 name = fn.get("name", "")
                 args = fn.get("arguments")
                 if isinstance(args, str):
@@ -192,15 +286,15 @@ def run_chat_agent(
                         args = {}
                 elif args is None:
                     args = {}
-                result = execute_tool(name, args)
+                result, result_preview = await aexecute_tool(name, args, preview=500)
                 messages.append({"role": "tool", "tool_name": name, "content": result})
-                cb("tool_call", {"name": name, "arguments": args, "result": result[:500]})
+                await cb("tool_call", {"name": name, "arguments": args, "result": result_preview})
         else:
             if content or full_reply:
                 messages.append({"role": "assistant", "content": content or full_reply})
-            cb("done", {})
+            await cb("done", {})
             break
     else:
-        cb("done", {})  # max rounds reached
+        await cb("done", {})  # max rounds reached
 
     return full_reply
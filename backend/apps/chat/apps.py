@@ -8,3 +8,9 @@ class ChatConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.chat"
     verbose_name = "Chat"
+
+    def ready(self) -> None:
+        """Create the process-wide async HTTP client used to stream from Ollama."""
+        from .agent import get_async_client
+
+        get_async_client()
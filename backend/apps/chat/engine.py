@@ -3,7 +3,7 @@ KubeMemory Chat Engine.
 
 Manages a multi-turn conversation with full tool use.
 Uses LangGraph pipeline tools under the hood.
-Streams tokens back via a generator for SSE.
+Streams tokens back via an async generator for SSE.
 
 Design:
   - User sends message + session_id
@@ -12,19 +12,36 @@ Design:
   - Calls Ollama with tool definitions
   - If Ollama wants to call a tool → run tool → append result → continue
   - Stream final response tokens back
-  - Save all messages to DB
+  - Save the turn's messages to DB in one batch
 """
-import json
+import asyncio
+import itertools
 import logging
 import os
 import time
-from typing import Any, Generator
-
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Mapping
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from langchain_core.runnables import Runnable
+from celery.result import AsyncResult
 from langchain_ollama import ChatOllama
 
-from .models import ChatMessage, ChatSession
-from .tools import CHAT_TOOLS, execute_tool
+from .models import LAST_MESSAGE_ROLES, ChatMessage, ChatSession
+from .tasks import run_analyze_pod
+from .tools import CHAT_TOOLS, aexecute_tool, normalize_tool_args
 
 logger = logging.getLogger("apps.chat")
 
@@ -57,81 +74,193 @@ Current cluster namespace context: {namespace}
 """
 
 
+@lru_cache(maxsize=64)
+def _system_message_for(namespace: str) -> SystemMessage:
+    """Formatted system prompt per namespace; shared across turns (never mutated)."""
+    return SystemMessage(content=SYSTEM_PROMPT.format(namespace=namespace))
+
+
+@lru_cache(maxsize=4)
+def _bound_llm(model: str, base_url: str) -> Runnable:
+    """ChatOllama with CHAT_TOOLS bound, built once per (model, base_url) and shared by engines."""
+    return ChatOllama(model=model, base_url=base_url, temperature=0.1).bind_tools(CHAT_TOOLS)
+
+
+# Human-readable tool_call event descriptions.
+_TOOL_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+    "search_incidents": "Searching incident history...",
+    "analyze_pod": "Running LangGraph 3-agent analysis...",
+    "get_blast_radius": "Querying blast radius for this pod...",
+    "get_top_blast_radius_services": "Finding services with largest blast radius...",
+    "get_patterns": "Loading cluster patterns...",
+    "get_pod_timeline": "Fetching pod incident timeline...",
+    "risk_check": "Running pre-deploy risk assessment...",
+    "get_graph_context": "Loading knowledge graph data...",
+})
+
+# Long-running tools handed to a Celery worker so the SSE connection only waits on the
+# result; they run inline when the broker is unreachable.
+_BACKGROUND_TOOLS = MappingProxyType({"analyze_pod": run_analyze_pod})
+BACKGROUND_TOOL_TIMEOUT = 300.0
+BACKGROUND_TOOL_POLL_SECONDS = 0.5
+
+# Upper bound on a stored/replayed tool output (LangGraph traces can run to megabytes).
+TOOL_OUTPUT_MAX_CHARS = 65536
+
+# Prior messages kept in the model context (plus the system prompt); older ones are
+# neither loaded nor sent.
+HISTORY_MAX_MESSAGES = 40
+
+
 class ChatEngine:
     """Runs the chat conversation with tool use and streaming."""
 
-    def __init__(self, session: ChatSession) -> None:
+    def __init__(self, session: ChatSession, max_history: int = HISTORY_MAX_MESSAGES) -> None:
         self.session = session
-        self.llm = ChatOllama(
-            model=os.environ.get("OLLAMA_CHAT_MODEL", "mistral:7b"),
-            base_url=os.environ.get("OLLAMA_BASE_URL", "http://ollama:11434"),
-            temperature=0.1,
+        self.llm_with_tools = _bound_llm(
+            os.environ.get("OLLAMA_CHAT_MODEL", "mistral:7b"),
+            os.environ.get("OLLAMA_BASE_URL", "http://ollama:11434"),
         )
-
-    def _load_history(self) -> list:
-        """Load conversation history as LangChain message objects."""
-        messages: list = [
-            SystemMessage(
-                content=SYSTEM_PROMPT.format(namespace=self.session.namespace)
-            )
-        ]
-        for msg in self.session.messages.all():
-            if msg.role == "user":
-                messages.append(HumanMessage(content=msg.content or ""))
-            elif msg.role == "assistant":
-                messages.append(AIMessage(content=msg.content or ""))
-            elif msg.role == "tool_result":
+        self._system_msg = _system_message_for(session.namespace)
+        # Bounded ring of prior turns, loaded once per engine; this turn's messages are
+        # appended in memory and the oldest fall off in O(1).
+        self._history: deque = deque(self._load_history(max_history), maxlen=max_history)
+        self._pending: list[ChatMessage] = []
+        # Fallback tool_call ids (len(history) stops growing once the ring is full).
+        self._call_seq = itertools.count()
+
+    def _load_history(self, limit: int) -> list:
+        """Load the newest `limit` messages (oldest first) as LangChain message objects."""
+        messages: list = []
+        # Plain tuples of the four columns replayed; tool_input and the rest stay in the DB.
+        stored = self.session.messages.order_by("-created_at", "-id").values_list(
+            "id", "role", "content", "tool_output"
+        )[:limit]
+        for msg_id, role, content, tool_output in reversed(list(stored)):
+            if role == "user":
+                messages.append(HumanMessage(content=content or ""))
+            elif role == "assistant":
+                messages.append(AIMessage(content=content or ""))
+            elif role == "tool_result":
                 messages.append(
                     ToolMessage(
-                        content=msg.tool_output or "",
-                        tool_call_id=str(msg.id),
+                        content=tool_output or "",
+                        tool_call_id=str(msg_id),
                     )
                 )
         return messages
 
-    def _save_message(
-        self, role: str, content: str, **kwargs: Any
-    ) -> ChatMessage:
-        """Persist a message to the database."""
-        msg = ChatMessage.objects.create(
-            session=self.session,
-            role=role,
-            content=content,
-            **kwargs,
+    def _queue_message(self, role: str, content: str, **kwargs: Any) -> None:
+        """Buffer a message for the next _flush_messages()."""
+        self._pending.append(
+            ChatMessage(session=self.session, role=role, content=content, **kwargs)
         )
-        self.session.message_count += 1
-        self.session.save(update_fields=["message_count", "updated_at"])
-        return msg
+
+    def _flush_messages(self) -> list[ChatMessage]:
+        """
+        Persist buffered messages with one INSERT and bump the session counters (and the
+        denormalized last user/assistant message) with one UPDATE.
+        Returns the created messages (with ids) in queue order.
+        """
+        if not self._pending:
+            return []
+        pending, self._pending = self._pending, []
+        updates: dict[str, Any] = {
+            "message_count": F("message_count") + len(pending),
+            "updated_at": timezone.now(),
+        }
+        last = next((m for m in reversed(pending) if m.role in LAST_MESSAGE_ROLES), None)
+        if last is not None:
+            updates["last_message_role"] = last.role
+            updates["last_message_preview"] = (last.content or "")[:120]
+        with transaction.atomic():
+            created = ChatMessage.objects.bulk_create(pending)
+            ChatSession.objects.filter(pk=self.session.pk).update(**updates)
+        # Mirror the UPDATE on the in-memory session instead of a refresh_from_db() round-trip.
+        self.session.message_count += len(created)
+        self.session.updated_at = updates["updated_at"]
+        if last is not None:
+            self.session.last_message_role = updates["last_message_role"]
+            self.session.last_message_preview = updates["last_message_preview"]
+        return created
 
     def _tool_description(self, tool_name: str) -> str:
         """Human-readable description for tool call events."""
-        descriptions = {
-            "search_incidents": "Searching incident history...",
-            "analyze_pod": "Running LangGraph 3-agent analysis...",
-            "get_blast_radius": "Querying blast radius for this pod...",
-            "get_top_blast_radius_services": "Finding services with largest blast radius...",
-            "get_patterns": "Loading cluster patterns...",
-            "get_pod_timeline": "Fetching pod incident timeline...",
-            "risk_check": "Running pre-deploy risk assessment...",
-            "get_graph_context": "Loading knowledge graph data...",
-        }
-        return descriptions.get(tool_name, f"Calling {tool_name}...")
+        return _TOOL_DESCRIPTIONS.get(tool_name, f"Calling {tool_name}...")
+
+    def _dispatch_background(self, tool_name: str, tool_input: dict) -> str | None:
+        """Queue a _BACKGROUND_TOOLS call on Celery; returns the task id, or None to run inline."""
+        task = _BACKGROUND_TOOLS.get(tool_name)
+        if task is None or not (tool_input.get("pod_name") or "").strip():
+            return None  # not offloaded; execute_tool's own guard answers a missing pod
+        try:
+            return task.delay(
+                pod_name=tool_input["pod_name"],
+                namespace=tool_input.get("namespace") or self.session.namespace,
+                incident_type=tool_input.get("incident_type") or "Unknown",
+            ).id
+        except Exception as e:
+            logger.warning("Could not queue %s on Celery, running inline: %s", tool_name, e)
+            return None
+
+    async def _await_task(self, task_id: str) -> str:
+        """Poll a background tool task until it finishes; raises on failure or timeout."""
+        result = AsyncResult(task_id)
+        ready = sync_to_async(result.ready, thread_sensitive=False)
+        deadline = time.monotonic() + BACKGROUND_TOOL_TIMEOUT
+        while not await ready():
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"task {task_id} still running after {BACKGROUND_TOOL_TIMEOUT:.0f}s"
+                )
+            await asyncio.sleep(BACKGROUND_TOOL_POLL_SECONDS)
+        return await sync_to_async(result.get, thread_sensitive=False)(timeout=5)
+
+    async def _run_tool(
+        self, index: int, tool_name: str, tool_input: dict, task_id: str | None = None
+    ) -> tuple[int, str, bool, bool, int]:
+        """
+        Run one tool, or wait on its Celery task when task_id is set.
+        Returns (index, output, success, cached, latency_ms). Never raises.
+        """
+        tool_start = time.time()
+        cached = False
+        try:
+            if task_id:
+                tool_output = await self._await_task(task_id)
+            else:
+                tool_output, cached = await aexecute_tool(
+                    tool_name,
+                    tool_input,
+                    namespace=self.session.namespace,
+                )
+            success = True
+        except Exception as e:
+            tool_output = f"Tool error: {str(e)}"
+            success = False
+        latency_ms = int((time.time() - tool_start) * 1000)
+        # Clamp once so history, the DB row and every later slice work on a bounded string.
+        return index, (tool_output or "")[:TOOL_OUTPUT_MAX_CHARS], success, cached, latency_ms
 
-    def stream_response(self, user_message: str) -> Generator[dict, None, None]:
+    async def astream_response(self, user_message: str) -> AsyncGenerator[dict, None]:
         """
         Main entry point. Yields SSE-compatible dicts:
           {"type": "token",       "content": "partial text"}
-          {"type": "tool_call",   "tool": "...", "input": {...}}
-          {"type": "tool_result", "tool": "...", "output": "...", "success": bool}
+          {"type": "tool_call",   "tool": "...", "input": {...}, "task_id": "..." | None}
+          {"type": "tool_result", "tool": "...", "output": "...", "success": bool, "cached": bool}
           {"type": "done",        "message_id": 42, "latency_ms": 1234}
           {"type": "error",       "message": "..."}
+        Tokens are Ollama's stream deltas, forwarded as they arrive; DB and tool work run
+        off the event loop.
         """
         start = time.time()
 
-        self._save_message("user", user_message)
-        self.session.auto_title()
+        # Saved right away: auto_title reads it, and the question survives a failed turn.
+        self._queue_message("user", user_message)
+        await sync_to_async(self._flush_messages)()
+        await sync_to_async(self.session.auto_title)()
 
-        history = self._load_history()
+        history = self._history
         history.append(HumanMessage(content=user_message))
 
         try:
@@ -139,60 +268,85 @@ class ChatEngine:
             tool_calls_made: list[str] = []
 
             while True:
-                llm_with_tools = self.llm.bind_tools(CHAT_TOOLS)
-                response = llm_with_tools.invoke(history)
-
-                if hasattr(response, "tool_calls") and response.tool_calls:
-                    for tc in response.tool_calls:
-                        tool_name = tc.get("name") or ""
-                        tool_input = tc.get("args") or {}
-                        tool_id = tc.get("id") or str(len(history))
-
+                response: AIMessageChunk | None = None
+                content_parts: list[str] = []
+                async for chunk in self.llm_with_tools.astream([self._system_msg, *history]):
+                    response = chunk if response is None else response + chunk
+                    if chunk.content and isinstance(chunk.content, str):
+                        content_parts.append(chunk.content)
+                        yield {"type": "token", "content": chunk.content}
+
+                tool_calls = response.tool_calls if response is not None else None
+                if tool_calls:
+                    # LangChain ToolCall dicts always carry name/args/id (id may be None).
+                    # args are normalized to a dict once: it is what the tool, the cache key,
+                    # the SSE event and the tool_input JSONField all receive.
+                    calls = [
+                        (
+                            name or "",
+                            normalize_tool_args(args),
+                            tid or f"call-{next(self._call_seq)}",
+                        )
+                        for name, args, tid in (
+                            (tc["name"], tc["args"], tc["id"]) for tc in tool_calls
+                        )
+                    ]
+                    # Independent tools run concurrently: announce them all, then report
+                    # each result as it finishes.
+                    dispatch = sync_to_async(self._dispatch_background, thread_sensitive=False)
+                    task_ids = [
+                        await dispatch(tool_name, tool_input)
+                        if tool_name in _BACKGROUND_TOOLS
+                        else None
+                        for tool_name, tool_input, _tool_id in calls
+                    ]
+                    for (tool_name, tool_input, _tool_id), task_id in zip(calls, task_ids):
                         yield {
                             "type": "tool_call",
                             "tool": tool_name,
                             "input": tool_input,
                             "description": self._tool_description(tool_name),
+                            "task_id": task_id,
                         }
 
-                        tool_start = time.time()
-                        try:
-                            tool_output = execute_tool(
-                                tool_name,
-                                tool_input,
-                                namespace=self.session.namespace,
-                            )
-                            success = True
-                        except Exception as e:
-                            tool_output = f"Tool error: {str(e)}"
-                            success = False
-
-                        tool_latency = int((time.time() - tool_start) * 1000)
+                    outcomes: list[tuple[str, bool, int] | None] = [None] * len(calls)
+                    tasks = [
+                        asyncio.ensure_future(self._run_tool(i, tool_name, tool_input, task_ids[i]))
+                        for i, (tool_name, tool_input, _tool_id) in enumerate(calls)
+                    ]
+                    for finished in asyncio.as_completed(tasks):
+                        i, tool_output, success, cached, tool_latency = await finished
+                        outcomes[i] = (tool_output, success, tool_latency)
+                        yield {
+                            "type": "tool_result",
+                            "tool": calls[i][0],
+                            "output": tool_output[:300],
+                            "success": success,
+                            "cached": cached,
+                            "latency_ms": tool_latency,
+                        }
 
-                        self._save_message(
+                    # History and DB rows in call order so tool_call_id <-> result stays paired.
+                    for (tool_name, tool_input, tool_id), outcome, task_id in zip(
+                        calls, outcomes, task_ids
+                    ):
+                        tool_output, success, tool_latency = outcome
+                        self._queue_message(
                             "tool_call",
                             f"Calling {tool_name}",
                             tool_name=tool_name,
                             tool_input=tool_input,
+                            task_id=task_id or "",
                             latency_ms=tool_latency,
                         )
-                        tool_result_msg = self._save_message(
+                        self._queue_message(
                             "tool_result",
-                            (tool_output or "")[:500],
+                            tool_output[:500],
                             tool_name=tool_name,
-                            tool_output=tool_output or "",
+                            tool_output=tool_output,
                             tool_success=success,
                             latency_ms=tool_latency,
                         )
-
-                        yield {
-                            "type": "tool_result",
-                            "tool": tool_name,
-                            "output": (tool_output or "")[:300],
-                            "success": success,
-                            "latency_ms": tool_latency,
-                        }
-
                         history.append(
                             AIMessage(
                                 content="",
@@ -207,7 +361,7 @@ class ChatEngine:
                         )
                         history.append(
                             ToolMessage(
-                                content=tool_output or "",
+                                content=tool_output,
                                 tool_call_id=tool_id,
                             )
                         )
@@ -215,23 +369,18 @@ class ChatEngine:
 
                     continue
 
-                response_content = response.content or ""
-                full_response = response_content
-
-                words = response_content.split(" ")
-                for i, word in enumerate(words):
-                    chunk = word + (" " if i < len(words) - 1 else "")
-                    yield {"type": "token", "content": chunk}
-
+                # Persisted text is exactly what was streamed.
+                full_response = "".join(content_parts)
                 break
 
             latency_ms = int((time.time() - start) * 1000)
-            saved_msg = self._save_message(
+            self._queue_message(
                 "assistant",
                 full_response,
                 latency_ms=latency_ms,
                 tokens_used=len(full_response.split()),
             )
+            saved_msg = (await sync_to_async(self._flush_messages)())[-1]
 
             yield {
                 "type": "done",
@@ -242,4 +391,8 @@ class ChatEngine:
 
         except Exception as e:
             logger.error("Chat engine error: %s", e, exc_info=True)
+            try:
+                await sync_to_async(self._flush_messages)()  # keep the tool trail of a failed turn
+            except Exception:
+                logger.exception("Could not save chat messages for session %s", self.session.pk)
             yield {"type": "error", "message": str(e)}
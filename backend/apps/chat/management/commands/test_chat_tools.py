@@ -6,10 +6,12 @@ Usage: python manage.py test_chat_tools
        python manage.py test_chat_tools --tool get_top_blast_radius_services
 """
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from django.core.management.base import BaseCommand
+from django.db import connection
 
-from apps.chat.tools import CHAT_TOOLS, execute_tool
+from apps.chat.tools import CHAT_TOOLS, cached_execute_tool
 from apps.incidents.models import Incident
 
 
@@ -35,6 +37,20 @@ TOOL_TEST_CASES = [
 ]
 
 
+def run_tool_case(
+    name: str, arguments: dict, namespace: str
+) -> tuple[str, bool, int, Exception | None]:
+    """Run one tool in a worker thread; returns (output, cached, elapsed_ms, error)."""
+    start = time.time()
+    try:
+        out, cached = cached_execute_tool(name, arguments, namespace=namespace)
+        return out, cached, int((time.time() - start) * 1000), None
+    except Exception as e:
+        return "", False, int((time.time() - start) * 1000), e
+    finally:
+        connection.close()  # each worker thread opened its own DB connection
+
+
 class Command(BaseCommand):
     help = "Run all chat tools from the backend and print full output"
 
@@ -89,18 +105,24 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR(f"No tool named '{tool_filter}'"))
             return
 
+        # Tools are independent I/O: run them together (wall time ~ slowest tool), then
+        # print results in test order.
+        with ThreadPoolExecutor(max_workers=min(8, len(tests))) as pool:
+            futures = [
+                pool.submit(run_tool_case, name, arguments, namespace) for name, arguments in tests
+            ]
+            results = [f.result() for f in futures]
+
         all_ok = True
-        for name, arguments in tests:
+        for (name, _arguments), (out, cached, elapsed_ms, error) in zip(tests, results):
             self.stdout.write(f"\n--- {name} ---")
-            start = time.time()
-            try:
-                out = execute_tool(name, arguments, namespace=namespace)
-                elapsed_ms = int((time.time() - start) * 1000)
-                self.stdout.write(out or "(empty)")
-                self.stdout.write(self.style.SUCCESS(f"  [{elapsed_ms}ms] OK"))
-            except Exception as e:
+            if error is not None:
                 all_ok = False
-                self.stdout.write(self.style.ERROR(f"  ERROR: {e}"))
+                self.stdout.write(self.style.ERROR(f"  ERROR: {error}"))
+                continue
+            self.stdout.write(out or "(empty)")
+            suffix = " (cached)" if cached else ""
+            self.stdout.write(self.style.SUCCESS(f"  [{elapsed_ms}ms] OK{suffix}"))
 
         self.stdout.write("")
         self.stdout.write("━" * 60)
@@ -0,0 +1,41 @@
+# Denormalized last user/assistant message on ChatSession for the sidebar list.
+
+from django.db import migrations, models
+
+
+def backfill_last_message(apps, schema_editor):
+    ChatSession = apps.get_model("chat", "ChatSession")
+    ChatMessage = apps.get_model("chat", "ChatMessage")
+    for session in ChatSession.objects.all().iterator():
+        last = (
+            ChatMessage.objects.filter(session=session, role__in=["user", "assistant"])
+            .order_by("-created_at", "-id")
+            .first()
+        )
+        if last is None:
+            continue
+        ChatSession.objects.filter(pk=session.pk).update(
+            last_message_role=last.role,
+            last_message_preview=(last.content or "")[:120],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0001_phase6_chat_models"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chatsession",
+            name="last_message_role",
+            field=models.CharField(blank=True, max_length=20),
+        ),
+        migrations.AddField(
+            model_name="chatsession",
+            name="last_message_preview",
+            field=models.CharField(blank=True, max_length=120),
+        ),
+        migrations.RunPython(backfill_last_message, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Composite index for per-session history loads ordered by created_at.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0002_chatsession_last_message"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="chatmessage",
+            index=models.Index(fields=["session", "created_at"], name="chat_msg_sess_created_idx"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Celery task id for tool calls offloaded to a worker.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0003_chatmessage_session_created_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chatmessage",
+            name="task_id",
+            field=models.CharField(blank=True, max_length=255),
+        ),
+    ]
@@ -6,6 +6,11 @@ across multiple questions in the same session.
 import uuid
 
 from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+# Message roles shown as a session's "last message" (tool traffic is skipped).
+LAST_MESSAGE_ROLES = ("user", "assistant")
 
 
 class ChatSession(models.Model):
@@ -20,6 +25,9 @@ class ChatSession(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     message_count = models.IntegerField(default=0)
+    # Denormalized latest user/assistant message for the sidebar list (no message join).
+    last_message_role = models.CharField(max_length=20, blank=True)
+    last_message_preview = models.CharField(max_length=120, blank=True)
 
     class Meta:
         ordering = ["-updated_at"]
@@ -29,20 +37,28 @@ class ChatSession(models.Model):
 
     def auto_title(self) -> None:
         """Set title from the first user message so the sidebar shows a meaningful label."""
-        first = self.messages.filter(role="user").first()
-        if not first:
-            return
-        new_title = (first.content or "").strip()[:60]
-        if not new_title:
-            new_title = "New chat"
         current = (self.title or "").strip()
-        is_default = not current or current == "New chat" or current.startswith("New chat (")
-        if current and not is_default:
+        if current and current != "New chat" and not current.startswith("New chat ("):
+            return  # already titled: no query on later turns
+        first = (
+            self.messages.filter(role="user")
+            .order_by("created_at", "id")
+            .values_list("content", flat=True)
+            .first()
+        )
+        if first is None:
             return
-        self.title = new_title
-        from django.utils import timezone
-        self.updated_at = timezone.now()
-        self.save(update_fields=["title", "updated_at"])
+        new_title = (first or "").strip()[:60] or "New chat"
+        now = timezone.now()
+        # One conditional UPDATE: a concurrent turn that already titled the session wins.
+        updated = (
+            ChatSession.objects.filter(pk=self.pk)
+            .filter(Q(title="") | Q(title="New chat") | Q(title__startswith="New chat ("))
+            .update(title=new_title, updated_at=now)
+        )
+        if updated:
+            self.title = new_title
+            self.updated_at = now
 
 
 class ChatMessage(models.Model):
@@ -66,6 +82,8 @@ class ChatMessage(models.Model):
     # For tool_call messages
     tool_name = models.CharField(max_length=100, blank=True)
     tool_input = models.JSONField(null=True, blank=True)
+    # Celery task id when the tool ran in a worker (e.g. analyze_pod)
+    task_id = models.CharField(max_length=255, blank=True)
 
     # For tool_result messages
     tool_output = models.TextField(blank=True)
@@ -78,6 +96,10 @@ class ChatMessage(models.Model):
 
     class Meta:
         ordering = ["created_at"]
+        indexes = [
+            # History loads: WHERE session_id = ? ORDER BY created_at.
+            models.Index(fields=["session", "created_at"], name="chat_msg_sess_created_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"[{self.role}] {(self.content or '')[:50]}"
@@ -1,12 +1,19 @@
 """DRF serializers for ChatSession and ChatMessage."""
 from rest_framework.serializers import ModelSerializer, SerializerMethodField
 
-from .models import ChatMessage, ChatSession
+from .models import LAST_MESSAGE_ROLES, ChatMessage, ChatSession
 
 
 class ChatMessageSerializer(ModelSerializer):
     """Full message serializer for session detail."""
 
+    tool_output = SerializerMethodField()
+
+    def get_tool_output(self, obj: ChatMessage) -> str:
+        # Session detail annotates a DB-side prefix; other querysets carry the full column.
+        preview = getattr(obj, "tool_output_preview", None)
+        return preview if preview is not None else obj.tool_output
+
     class Meta:
         model = ChatMessage
         fields = [
@@ -15,11 +22,13 @@ class ChatMessageSerializer(ModelSerializer):
             "content",
             "tool_name",
             "tool_input",
+            "task_id",
             "tool_output",
             "tool_success",
             "latency_ms",
             "created_at",
         ]
+        read_only_fields = fields
 
 
 class ChatSessionSerializer(ModelSerializer):
@@ -29,7 +38,11 @@ class ChatSessionSerializer(ModelSerializer):
     last_message = SerializerMethodField()
 
     def get_last_message(self, obj: ChatSession):
-        msg = obj.messages.filter(role__in=["user", "assistant"]).last()
+        # Reuses the (prefetched) messages list instead of a second query per session.
+        msg = next(
+            (m for m in reversed(obj.messages.all()) if m.role in LAST_MESSAGE_ROLES),
+            None,
+        )
         return ChatMessageSerializer(msg).data if msg else None
 
     class Meta:
@@ -52,12 +65,11 @@ class ChatSessionListSerializer(ModelSerializer):
     last_message = SerializerMethodField()
 
     def get_last_message(self, obj: ChatSession):
-        msg = obj.messages.filter(role__in=["user", "assistant"]).last()
-        if not msg:
+        if not obj.last_message_role:
             return None
         return {
-            "role": msg.role,
-            "content": (msg.content or "")[:80],
+            "role": obj.last_message_role,
+            "content": obj.last_message_preview,
         }
 
     class Meta:
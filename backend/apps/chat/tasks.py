@@ -0,0 +1,23 @@
+"""Celery tasks for the chat engine: long-running tools run off the SSE connection."""
+import logging
+
+from celery import shared_task
+
+from .tools import execute_tool
+
+logger = logging.getLogger("apps.chat")
+
+
+@shared_task(bind=True, max_retries=1, default_retry_delay=5)
+def run_analyze_pod(
+    self, pod_name: str, namespace: str, incident_type: str = "Unknown"
+) -> str:
+    """Run the analyze_pod chat tool (full LangGraph pipeline) in a worker. Returns tool output."""
+    try:
+        return execute_tool(
+            "analyze_pod",
+            {"pod_name": pod_name, "namespace": namespace, "incident_type": incident_type},
+        )
+    except Exception as exc:
+        logger.warning("analyze_pod task failed for %s/%s: %s", namespace, pod_name, exc)
+        raise self.retry(exc=exc)
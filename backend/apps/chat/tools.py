@@ -3,10 +3,20 @@ Tool definitions for the chat engine.
 Same capabilities as MCP tools; structured as LangChain tools for in-app chat.
 ALL logic delegates to apps/memory/ and apps/agents/ — no duplication.
 """
+import hashlib
+from typing import Any
+
+import orjson
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db.models import Prefetch
+from django.db.models.functions import Substr
 from langchain_core.tools import tool
 
-from apps.incidents.models import ClusterPattern, Incident
-from apps.memory.graph_builder import KubeGraphBuilder
+from apps.agents.pipeline import analyze_incident
+from apps.agents.views import compute_risk_check
+from apps.incidents.models import ClusterPattern, Fix, Incident
+from apps.memory.graph_builder import get_shared_graph
 from apps.memory.vector_store import IncidentVectorStore
 
 
@@ -50,22 +60,23 @@ def analyze_pod(
     Use for: 'analyze payment-service', 'why does auth-service keep crashing',
     'give me a full analysis of worker pod'
     """
-    from apps.agents.pipeline import analyze_incident
-
-    incident = (
+    # Two columns of the newest incident (incident_pod_recent_idx); a stored analysis is
+    # returned as-is and the LangGraph pipeline is skipped.
+    row = (
         Incident.objects.filter(pod_name=pod_name, namespace=namespace)
         .order_by("-occurred_at")
+        .values("id", "ai_analysis")
         .first()
     )
 
-    if not incident:
+    if row is None:
         return (
             f"No incidents found for {pod_name} in {namespace}. "
             "The pod may be healthy or not yet tracked."
         )
 
-    if not incident.ai_analysis:
-        state = analyze_incident(incident.id)
+    if not row["ai_analysis"]:
+        state = analyze_incident(row["id"])
         return (
             f"ANALYSIS for {pod_name}:\n\n"
             f"ROOT CAUSE: {state.get('root_cause', 'unknown')}\n\n"
@@ -74,7 +85,7 @@ def analyze_pod(
             f"PREVENTION: {state.get('prevention_advice', 'none')}"
         )
 
-    return f"STORED ANALYSIS for {pod_name}:\n\n{incident.ai_analysis}"
+    return f"STORED ANALYSIS for {pod_name}:\n\n{row['ai_analysis']}"
 
 
 @tool
@@ -84,11 +95,7 @@ def get_blast_radius(pod_name: str, namespace: str) -> str:
     Use for: 'blast radius of payment-service', 'what breaks when X goes down',
     'downstream impact of auth-service failure'
     """
-    graph = KubeGraphBuilder()
-    try:
-        results = graph.find_blast_radius(pod_name, namespace)
-    finally:
-        graph.close()
+    results = get_shared_graph().find_blast_radius(pod_name, namespace)
 
     if not results:
         return (
@@ -123,11 +130,7 @@ def get_top_blast_radius_services(namespace: str = "default", limit: int = 10) -
     'what has the biggest impact when it goes down', 'highest blast radius services'.
     Does NOT require a specific pod name — use this for cluster-wide blast radius ranking.
     """
-    graph = KubeGraphBuilder()
-    try:
-        results = graph.find_top_blast_radius_pods(namespace=namespace, limit=limit)
-    finally:
-        graph.close()
+    results = get_shared_graph().find_top_blast_radius_pods(namespace=namespace, limit=limit)
 
     if not results:
         return (
@@ -154,7 +157,9 @@ def get_patterns(namespace: str | None = None, limit: int = 8) -> str:
     Use for: 'what keeps breaking', 'most common incidents',
     'recurring problems', 'cluster patterns'
     """
-    qs = ClusterPattern.objects.all()
+    qs = ClusterPattern.objects.only(
+        "pod_name", "namespace", "incident_type", "frequency", "fix_success_rate"
+    ).annotate(best_fix_excerpt=Substr("best_fix", 1, 100))
     if namespace:
         qs = qs.filter(namespace=namespace)
     patterns = list(qs.order_by("-frequency")[:limit])
@@ -164,8 +169,8 @@ def get_patterns(namespace: str | None = None, limit: int = 8) -> str:
 
     lines = [f"Top {len(patterns)} recurring patterns:\n"]
     for p in patterns:
-        best = (p.best_fix or "")[:100] if p.best_fix else "none recorded"
-        rate = getattr(p, "fix_success_rate", 0.0) or 0.0
+        best = p.best_fix_excerpt or "none recorded"
+        rate = p.fix_success_rate or 0.0
         lines.append(
             f"• {p.pod_name} ({p.namespace}) — {p.incident_type} "
             f"× {p.frequency} times | fix success: {rate:.0%}\n"
@@ -183,9 +188,19 @@ def get_pod_timeline(
     Use for: 'history of payment-service', 'timeline of auth crashes',
     'all incidents for worker pod', 'what happened to X pod'
     """
-    incidents = (
+    # Working fixes for the whole page in one prefetch query (newest first, as Fix.Meta).
+    incidents = list(
         Incident.objects.filter(pod_name=pod_name, namespace=namespace)
-        .order_by("-occurred_at")[:limit]
+        .order_by("-occurred_at")
+        .prefetch_related(
+            Prefetch(
+                "fixes",
+                queryset=Fix.objects.filter(worked=True)
+                .only("id", "incident_id", "description")
+                .order_by("-created_at"),
+                to_attr="working_fixes",
+            )
+        )[:limit]
     )
 
     if not incidents:
@@ -195,14 +210,10 @@ def get_pod_timeline(
         f"Incident timeline for {pod_name} ({len(incidents)} incidents):\n"
     ]
     for i in incidents:
-        fixes = i.fixes.filter(worked=True)
-        fix_str = (
-            f"✓ fixed: {fixes.first().description[:60]}"
-            if fixes.exists()
-            else "✗ no fix recorded"
-        )
+        wf = i.working_fixes
+        fix_str = f"✓ fixed: {wf[0].description[:60]}" if wf else "✗ no fix recorded"
         lines.append(
-            f"  [{i.occurred_at.strftime('%Y-%m-%d %H:%M')}] "
+            f"  [{i.occurred_at.isoformat(sep=' ', timespec='minutes')[:16]}] "
             f"{i.incident_type} — {i.severity.upper()} — {i.status}\n"
             f"  {fix_str}"
         )
@@ -216,8 +227,6 @@ def risk_check(service_name: str, namespace: str) -> str:
     Use for: 'is it safe to deploy payment-service',
     'risk of deploying to production', 'should I deploy now'
     """
-    from apps.agents.views import compute_risk_check
-
     result = compute_risk_check(service_name, namespace)
     level = (result.get("risk_level") or "low").upper()
     emoji = "🔴" if level == "HIGH" else "🟡" if level == "MEDIUM" else "🟢"
@@ -246,26 +255,35 @@ def get_graph_context(namespace: str) -> str:
     Use for: 'what does the graph look like', 'show me the cluster topology',
     'what services are in production'
     """
-    graph = KubeGraphBuilder()
-    try:
-        data = graph.get_graph_data_for_namespace(namespace)
-    finally:
-        graph.close()
+    data = get_shared_graph().get_graph_data_for_namespace(namespace)
 
     nodes = data.get("nodes") or []
     links = data.get("links") or []
-    pods = [n for n in nodes if n.get("type") == "Pod"]
-    services = [n for n in nodes if n.get("type") == "Service"]
-    incidents = [n for n in nodes if n.get("type") == "Incident"]
+    # One pass: count each node type and keep only the names that are displayed.
+    n_pods = n_services = n_incidents = 0
+    pod_names: list = []
+    open_incident_names: list = []
+    for n in nodes:
+        node_type = n.get("type")
+        if node_type == "Pod":
+            n_pods += 1
+            if len(pod_names) < 10:
+                pod_names.append(n.get("name"))
+        elif node_type == "Service":
+            n_services += 1
+        elif node_type == "Incident":
+            n_incidents += 1
+            if not n.get("resolved") and len(open_incident_names) < 5:
+                open_incident_names.append(n.get("name"))
 
     return (
         f"Graph context for {namespace}:\n"
-        f"  {len(pods)} pods tracked\n"
-        f"  {len(services)} services\n"
-        f"  {len(incidents)} incident nodes\n"
+        f"  {n_pods} pods tracked\n"
+        f"  {n_services} services\n"
+        f"  {n_incidents} incident nodes\n"
         f"  {len(links)} causal relationships\n\n"
-        f"Pods: {[p.get('name') for p in pods[:10]]}\n"
-        f"Open incidents: {[n.get('name') for n in incidents if not n.get('resolved')][:5]}"
+        f"Pods: {pod_names}\n"
+        f"Open incidents: {open_incident_names}"
     )
 
 
@@ -280,19 +298,23 @@ CHAT_TOOLS = [
     get_graph_context,
 ]
 
+_TOOL_MAP: dict[str, Any] = {t.name: t for t in CHAT_TOOLS}
+# Tools that need one named pod; "all"-style placeholders are answered with guidance.
+_POD_REQUIRED = frozenset({"get_pod_timeline", "get_blast_radius", "analyze_pod"})
+
 
 def execute_tool(
     name: str, args: dict, namespace: str | None = None
 ) -> str:
     """Dispatch tool call by name. Injects session namespace when missing."""
-    if namespace and "namespace" not in args:
-        args = {**args, "namespace": namespace}
-    tool_map = {t.name: t for t in CHAT_TOOLS}
-    if name not in tool_map:
+    if namespace:
+        args = {"namespace": namespace, **args}  # explicit tool args win
+    chat_tool = _TOOL_MAP.get(name)
+    if chat_tool is None:
         return f"Unknown tool: {name}"
 
     # Guard: tools that require a specific pod name — avoid validation errors
-    if name in ("get_pod_timeline", "get_blast_radius", "analyze_pod"):
+    if name in _POD_REQUIRED:
         pod_name = (args.get("pod_name") or "").strip().lower()
         if not pod_name or pod_name in ("all", "any", "?", "none"):
             return (
@@ -302,4 +324,59 @@ def execute_tool(
                 "For broad incident queries use search_incidents with a natural-language query."
             )
 
-    return tool_map[name].invoke(args)
+    return chat_tool.invoke(args)
+
+
+# Read-only tools whose output changes on the order of minutes: results are shared
+# across turns and sessions for CHAT_TOOL_CACHE_SECONDS. analyze_pod/risk_check stay live.
+CACHEABLE_TOOLS = frozenset({
+    "get_patterns",
+    "get_top_blast_radius_services",
+    "get_graph_context",
+    "get_pod_timeline",
+    "search_incidents",
+})
+CHAT_TOOL_CACHE_SECONDS = 60
+
+
+def normalize_tool_args(args: Any) -> dict:
+    """Tool-call arguments as a dict; Ollama sometimes sends them as a JSON string."""
+    if isinstance(args, dict):
+        return args
+    if isinstance(args, (str, bytes)) and args:
+        try:
+            parsed = orjson.loads(args)
+        except orjson.JSONDecodeError:
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+    return {}
+
+
+def tool_cache_key(name: str, args: dict, namespace: str | None = None) -> str:
+    """Result-cache key: blake2b of the canonical (sorted-key) JSON of args + namespace."""
+    canonical = orjson.dumps({**args, "ns": namespace}, option=orjson.OPT_SORT_KEYS, default=str)
+    return f"tool:{name}:{hashlib.blake2b(canonical, digest_size=16).hexdigest()}"
+
+
+def cached_execute_tool(
+    name: str, args: dict, namespace: str | None = None
+) -> tuple[str, bool]:
+    """execute_tool with a short-TTL result cache for CACHEABLE_TOOLS. Returns (output, cached)."""
+    if name not in CACHEABLE_TOOLS:
+        return execute_tool(name, args, namespace=namespace), False
+    key = tool_cache_key(name, args, namespace)
+    hit = cache.get(key)
+    if hit is not None:
+        return hit, True
+    out = execute_tool(name, args, namespace=namespace)
+    cache.set(key, out, timeout=CHAT_TOOL_CACHE_SECONDS)
+    return out, False
+
+
+async def aexecute_tool(
+    name: str, args: dict, namespace: str | None = None
+) -> tuple[str, bool]:
+    """Async cached_execute_tool: runs the (sync ORM/Chroma/Neo4j) tool in a worker thread."""
+    return await sync_to_async(cached_execute_tool, thread_sensitive=False)(
+        name, args, namespace=namespace
+    )
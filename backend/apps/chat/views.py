@@ -8,30 +8,158 @@ POST /api/chat/sessions/{id}/message/ → send message (SSE streaming)
 GET  /api/chat/suggestions/?ns=<ns>   → context-aware suggested questions
 GET  /api/chat/commands/              → slash command list
 """
+import asyncio
 import json
 import logging
+import time
+from typing import AsyncIterator
 
 from django.db import transaction
-from django.http import StreamingHttpResponse
+from django.db.models import Count, Prefetch, Window
+from django.db.models.functions import Substr
+from django.http import HttpResponse, StreamingHttpResponse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from .engine import ChatEngine
-from .models import ChatSession
+from .models import ChatMessage, ChatSession
 from .serializers import ChatSessionListSerializer, ChatSessionSerializer
 
 logger = logging.getLogger(__name__)
 
+# Per-stream SSE buffer: a slow client costs at most SSE_QUEUE_SIZE pending events. When
+# full, the oldest queued token is dropped (tool/done/error events are always kept) and the
+# done event then carries the full reply; a buffer stuck full for SSE_STALL_SECONDS ends
+# the stream with an error event.
+SSE_QUEUE_SIZE = 32
+SSE_STALL_SECONDS = 5.0
+
+
+def _drop_oldest_token(q: asyncio.Queue) -> bool:
+    """Remove the oldest queued token event; False if the queue holds no tokens."""
+    pending = []
+    dropped = False
+    while not q.empty():
+        ev = q.get_nowait()
+        if not dropped and ev is not None and ev.get("type") == "token":
+            dropped = True
+            continue
+        pending.append(ev)
+    for ev in pending:
+        q.put_nowait(ev)
+    return dropped
+
+
+async def _bounded_event_batches(events: AsyncIterator[dict]) -> AsyncIterator[list[dict]]:
+    """
+    Relay events through a bounded queue so the producer never outruns the client unbounded.
+    Yields everything already queued as one batch (never waits to fill one), so a client
+    that keeps up gets each event immediately and a lagging one gets fewer, larger writes.
+    """
+    q: asyncio.Queue = asyncio.Queue(maxsize=SSE_QUEUE_SIZE)
+    stalled = asyncio.Event()
+
+    async def produce() -> None:
+        parts: list[str] = []
+        dropped_tokens = False
+        full_since: float | None = None
+        try:
+            async for ev in events:
+                if ev.get("type") == "token":
+                    parts.append(ev.get("content") or "")
+                    if not q.full():
+                        full_since = None
+                    elif time.monotonic() - (full_since or time.monotonic()) > SSE_STALL_SECONDS:
+                        stalled.set()
+                        break
+                    else:
+                        full_since = full_since or time.monotonic()
+                        _drop_oldest_token(q)
+                        dropped_tokens = True
+                    if not q.full():  # still full: only tool/done events queued, skip token
+                        q.put_nowait(ev)
+                    continue
+                if ev.get("type") == "done" and dropped_tokens:
+                    ev = {**ev, "content": "".join(parts)}
+                try:
+                    await asyncio.wait_for(q.put(ev), SSE_STALL_SECONDS)
+                except asyncio.TimeoutError:
+                    stalled.set()
+                    break
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.exception("[chat] SSE producer failed")
+            await q.put({"type": "error", "message": str(e)})
+        await q.put(None)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        finished = False
+        while not finished:
+            batch = [await q.get()]
+            while not q.empty():
+                batch.append(q.get_nowait())
+            if batch[-1] is None:
+                batch.pop()
+                finished = True
+            if batch:
+                yield batch
+        if stalled.is_set():
+            logger.warning(
+                "[chat] SSE client stalled for %.0fs; stream cancelled", SSE_STALL_SECONDS
+            )
+            yield [{"type": "error", "message": "Client too slow; stream cancelled"}]
+    finally:
+        if not producer.done():
+            producer.cancel()
+
+
+# Session detail messages: only the serialized columns (plus session_id, which the prefetch
+# joins on), in display order. tool_output is sliced by the database; the full text stays
+# there.
+TOOL_OUTPUT_PREVIEW_CHARS = 4096
+_DETAIL_MESSAGES = (
+    ChatMessage.objects.only(
+        "id",
+        "session_id",
+        "role",
+        "content",
+        "tool_name",
+        "tool_input",
+        "task_id",
+        "tool_success",
+        "latency_ms",
+        "created_at",
+    )
+    .annotate(tool_output_preview=Substr("tool_output", 1, TOOL_OUTPUT_PREVIEW_CHARS))
+    .order_by("created_at", "id")
+)
+
 
 class ChatSessionListView(APIView):
     """List or create chat sessions. DELETE with ?all=1 clears all sessions."""
 
     def get(self, request):
-        sessions = list(ChatSession.objects.order_by("-updated_at")[:20])
+        # One query: the serialized columns only, with the table total as a window count
+        # (evaluated before LIMIT) instead of a separate COUNT(*).
+        sessions = list(
+            ChatSession.objects.only(
+                "id",
+                "title",
+                "namespace",
+                "message_count",
+                "updated_at",
+                "last_message_role",
+                "last_message_preview",
+            )
+            .annotate(total_in_db=Window(Count("id")))
+            .order_by("-updated_at")[:20]
+        )
         ids = [str(s.id) for s in sessions]
-        total = ChatSession.objects.count()
+        total = sessions[0].total_in_db if sessions else 0
         logger.info("[chat] GET /sessions/ list count=%s total_in_db=%s ids=%s", len(sessions), total, ids[:5])
         resp = Response(ChatSessionListSerializer(sessions, many=True).data)
         resp["Cache-Control"] = "no-store, no-cache, must-revalidate"
@@ -69,7 +197,9 @@ class ChatSessionDetailView(APIView):
 
     def get(self, request, session_id):
         try:
-            session = ChatSession.objects.get(id=session_id)
+            session = ChatSession.objects.prefetch_related(
+                Prefetch("messages", queryset=_DETAIL_MESSAGES)
+            ).get(id=session_id)
             return Response(ChatSessionSerializer(session).data)
         except ChatSession.DoesNotExist:
             logger.warning("[chat] GET /sessions/%s/ 404 not found", session_id)
@@ -90,8 +220,13 @@ class ChatSessionDetailView(APIView):
         session_id_str = str(session_id)
         with transaction.atomic():
             session.delete()
-        count_after = ChatSession.objects.count()
-        logger.info("[chat] DELETE /sessions/%s/ deleted ok total_in_db_now=%s", session_id_str, count_after)
+        if logger.isEnabledFor(logging.INFO):  # the COUNT(*) only feeds this log line
+            count_after = ChatSession.objects.count()
+            logger.info(
+                "[chat] DELETE /sessions/%s/ deleted ok total_in_db_now=%s",
+                session_id_str,
+                count_after,
+            )
         resp = Response(status=status.HTTP_204_NO_CONTENT)
         resp["Cache-Control"] = "no-store, no-cache, must-revalidate"
         return resp
@@ -118,9 +253,14 @@ class ChatMessageView(APIView):
 
         engine = ChatEngine(session)
 
-        def event_stream():
-            for event in engine.stream_response(user_message):
-                yield f"data: {json.dumps(event)}\n\n"
+        # Async iterator: under ASGI, Django streams it without tying up a worker thread;
+        # _bounded_event_batches caps what a slow client can make us buffer.
+        async def event_stream():
+            async for batch in _bounded_event_batches(engine.astream_response(user_message)):
+                # One write per batch; compact JSON keeps token frames small.
+                yield "".join(
+                    f"data: {json.dumps(event, separators=(',', ':'))}\n\n" for event in batch
+                )
             yield "data: [STREAM_END]\n\n"
 
         response = StreamingHttpResponse(
@@ -132,6 +272,36 @@ class ChatMessageView(APIView):
         return response
 
 
+# Fixed part of the suggestions list (shared, never mutated); only the critical-incident
+# entries and the namespace in the risk question vary per request.
+_PATTERNS_SUGGESTION = {
+    "text": "What are the most recurring problems in this cluster?",
+    "category": "patterns",
+    "icon": "🔁",
+    "tool_hint": "get_patterns",
+}
+_RISK_SUGGESTION = {
+    "text": "Is it safe to deploy to {ns} right now?",
+    "category": "risk",
+    "icon": "⚠️",
+    "tool_hint": "risk_check",
+}
+_STATIC_SUGGESTIONS: tuple[dict, ...] = (
+    {
+        "text": "Which services are most likely to cause a blast radius?",
+        "category": "blast_radius",
+        "icon": "💥",
+        "tool_hint": "get_blast_radius",
+    },
+    {
+        "text": "Show me all incidents from the last 7 days",
+        "category": "history",
+        "icon": "📅",
+        "tool_hint": "search_incidents",
+    },
+)
+
+
 class ChatSuggestionsView(APIView):
     """Context-aware suggested questions based on current cluster state."""
 
@@ -142,96 +312,86 @@ class ChatSuggestionsView(APIView):
 
         critical = (
             Incident.objects.filter(status="open", severity="critical")
+            .only("pod_name", "incident_type")
             .order_by("-occurred_at")[:3]
         )
 
-        suggestions = []
-        for inc in critical:
-            suggestions.append({
+        suggestions = [
+            {
                 "text": f"Why is {inc.pod_name} {inc.incident_type}?",
                 "category": "active_incident",
                 "icon": "🔴",
                 "tool_hint": "analyze_pod",
-            })
+            }
+            for inc in critical
+        ]
+        suggestions.append(_PATTERNS_SUGGESTION)
+        suggestions.append(
+            {**_RISK_SUGGESTION, "text": _RISK_SUGGESTION["text"].format(ns=namespace)}
+        )
+        suggestions.extend(_STATIC_SUGGESTIONS)
 
-        suggestions += [
+        return Response({
+            "suggestions": suggestions[:6],
+            "namespace": namespace,
+        })
+
+
+# Slash commands are static: encode the response body once.
+_COMMANDS_PAYLOAD = json.dumps(
+    {
+        "commands": [
             {
-                "text": "What are the most recurring problems in this cluster?",
-                "category": "patterns",
-                "icon": "🔁",
-                "tool_hint": "get_patterns",
+                "command": "/analyze",
+                "args": "<pod> <namespace>",
+                "description": "Deep analysis of a pod",
             },
             {
-                "text": f"Is it safe to deploy to {namespace} right now?",
-                "category": "risk",
-                "icon": "⚠️",
-                "tool_hint": "risk_check",
+                "command": "/history",
+                "args": "<pod> <namespace>",
+                "description": "Full incident timeline for a pod",
             },
             {
-                "text": "Which services are most likely to cause a blast radius?",
-                "category": "blast_radius",
-                "icon": "💥",
-                "tool_hint": "get_blast_radius",
+                "command": "/blast",
+                "args": "<pod> <namespace>",
+                "description": "Blast radius for a pod",
             },
             {
-                "text": "Show me all incidents from the last 7 days",
-                "category": "history",
-                "icon": "📅",
-                "tool_hint": "search_incidents",
+                "command": "/risk",
+                "args": "<service> <namespace>",
+                "description": "Pre-deploy risk check",
             },
-        ]
-
-        return Response({
-            "suggestions": suggestions[:6],
-            "namespace": namespace,
-        })
+            {
+                "command": "/patterns",
+                "args": "[namespace]",
+                "description": "Top recurring cluster patterns",
+            },
+            {
+                "command": "/search",
+                "args": "<query>",
+                "description": "Semantic search over incidents",
+            },
+            {
+                "command": "/clear",
+                "args": "",
+                "description": "Clear current session",
+            },
+            {
+                "command": "/new",
+                "args": "",
+                "description": "Start a new session",
+            },
+        ],
+    },
+    separators=(",", ":"),
+    ensure_ascii=False,
+).encode()
 
 
 class ChatCommandsView(APIView):
     """Return available slash commands."""
 
     def get(self, request):
-        return Response({
-            "commands": [
-                {
-                    "command": "/analyze",
-                    "args": "<pod> <namespace>",
-                    "description": "Deep analysis of a pod",
-                },
-                {
-                    "command": "/history",
-                    "args": "<pod> <namespace>",
-                    "description": "Full incident timeline for a pod",
-                },
-                {
-                    "command": "/blast",
-                    "args": "<pod> <namespace>",
-                    "description": "Blast radius for a pod",
-                },
-                {
-                    "command": "/risk",
-                    "args": "<service> <namespace>",
-                    "description": "Pre-deploy risk check",
-                },
-                {
-                    "command": "/patterns",
-                    "args": "[namespace]",
-                    "description": "Top recurring cluster patterns",
-                },
-                {
-                    "command": "/search",
-                    "args": "<query>",
-                    "description": "Semantic search over incidents",
-                },
-                {
-                    "command": "/clear",
-                    "args": "",
-                    "description": "Clear current session",
-                },
-                {
-                    "command": "/new",
-                    "args": "",
-                    "description": "Start a new session",
-                },
-            ],
-        })
+        response = HttpResponse(_COMMANDS_PAYLOAD, content_type="application/json")
+        response["Cache-Control"] = "public, max-age=3600"
+        return response
@@ -4,10 +4,15 @@ NEVER stores or logs kubeconfig content — only the path.
 """
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from functools import lru_cache
 from typing import Any
 
 import urllib3
+from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +20,125 @@ logger = logging.getLogger(__name__)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
+# Cap on namespaces returned by a connection test; API calls give up after this many seconds.
+NAMESPACE_LIST_LIMIT = 1000
+K8S_REQUEST_TIMEOUT = 4
+
+# Shared worker pool for connection tests. A per-call `with ThreadPoolExecutor()` paid a
+# thread spawn each time and its exit waited for the worker, so the 5s timeout never
+# actually returned early. Sized above TEST_ALL_CONCURRENCY so a bulk test never queues
+# single-cluster tests behind it (queue time counts against their 5s).
+TEST_ALL_CONCURRENCY = 4
+_test_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="k8s-test")
+# Fans out test_all over clusters; each task waits on a _test_executor worker.
+_test_all_executor = ThreadPoolExecutor(
+    max_workers=TEST_ALL_CONCURRENCY, thread_name_prefix="k8s-test-all"
+)
+
+# Mounted kubeconfig used when the stored path is missing (e.g. inside Docker); read once.
+K8S_KUBECONFIG_PATH = os.environ.get("K8S_KUBECONFIG_PATH", "").strip()
+
+# Kubeconfig existence checks are cached for ISFILE_TTL_SECONDS so repeated connection
+# tests (UI polling) don't stat() the same paths on every request.
+ISFILE_TTL_SECONDS = 5
+
+
+@lru_cache(maxsize=32)
+def _cached_isfile(path: str, epoch: int) -> bool:
+    return os.path.isfile(path)
+
+
+def _isfile(path: str) -> bool:
+    """os.path.isfile, memoized per path for ISFILE_TTL_SECONDS."""
+    return _cached_isfile(path, int(time.time()) // ISFILE_TTL_SECONDS)
+
+
+# Process-wide ApiClient pool keyed by (kubeconfig path, context): reusing a client keeps
+# its parsed config and its urllib3 connection pool (TLS sessions) across requests. An
+# entry is rebuilt when the kubeconfig file's mtime or size changes; least recently used clients
+# beyond API_CLIENT_POOL_SIZE are dropped. Clients are built with new_client_from_config,
+# so concurrent tests of different clusters never share the global default configuration.
+API_CLIENT_POOL_SIZE = 16
+IN_CLUSTER_POOL_KEY = ("<in-cluster>", "")
+_CLIENT_POOL: "OrderedDict[tuple[str, str], tuple[tuple[int, int], Any]]" = OrderedDict()
+_client_pool_lock = threading.Lock()
+
+
+def get_api_client(
+    kubeconfig_path: str = "", context_name: str = "", in_cluster: bool = False
+) -> Any:
+    """Return the pooled ApiClient for a kubeconfig/context (or in-cluster config)."""
+    from kubernetes import client, config
+
+    if in_cluster:
+        key, stamp = IN_CLUSTER_POOL_KEY, (0, 0)
+    else:
+        st = os.stat(kubeconfig_path)
+        key, stamp = (kubeconfig_path, context_name), (st.st_mtime_ns, st.st_size)
+    with _client_pool_lock:
+        entry = _CLIENT_POOL.get(key)
+        if entry is not None and entry[0] == stamp:
+            _CLIENT_POOL.move_to_end(key)
+            return entry[1]
+    if in_cluster:
+        configuration = client.Configuration()
+        config.load_incluster_config(client_configuration=configuration)
+        api_client = client.ApiClient(configuration)
+    else:
+        api_client = config.new_client_from_config(
+            config_file=kubeconfig_path, context=context_name or None
+        )
+    with _client_pool_lock:
+        _CLIENT_POOL[key] = (stamp, api_client)
+        _CLIENT_POOL.move_to_end(key)
+        while len(_CLIENT_POOL) > API_CLIENT_POOL_SIZE:
+            _CLIENT_POOL.popitem(last=False)
+    return api_client
+
+
+def _list_raw(api_client: Any, path: str, limit: int) -> dict[str, Any]:
+    """GET a core list endpoint with ?limit= and return the plain JSON dict."""
+    resp = api_client.call_api(
+        path,
+        "GET",
+        query_params=[("limit", limit)],
+        auth_settings=["BearerToken"],
+        response_type="object",
+        _request_timeout=K8S_REQUEST_TIMEOUT,
+    )
+    data = resp[0] if resp else None
+    return data if isinstance(data, dict) else {}
+
+
+# The API server's /version document only changes on upgrade: keep it per server URL for
+# SERVER_VERSION_CACHE_SECONDS in the shared cache so tests skip that round trip.
+SERVER_VERSION_CACHE_SECONDS = 600
+
+
+def _server_version(api_client: Any) -> str:
+    """gitVersion from GET /version (cached per API server host); "unknown" on failure."""
+    key = f"k8s_version:{api_client.configuration.host}"
+    cached = cache.get(key)
+    if cached:
+        return cached
+    try:
+        version_resp = api_client.call_api(
+            "/version",
+            "GET",
+            auth_settings=["BearerToken"],
+            response_type="object",
+            _request_timeout=K8S_REQUEST_TIMEOUT,
+        )
+    except Exception:
+        return "unknown"
+    git_version = ""
+    if version_resp and isinstance(version_resp[0], dict):
+        git_version = (version_resp[0].get("gitVersion") or "")[:50]
+    if git_version:
+        cache.set(key, git_version, timeout=SERVER_VERSION_CACHE_SECONDS)
+    return git_version
+
+
 def test_connection(
     connection_method: str,
     kubeconfig_path: str = "",
@@ -33,7 +157,7 @@ def test_connection(
         "error": "",
     }
     try:
-        from kubernetes import client, config
+        from kubernetes import client
     except ImportError:
         result["error"] = "kubernetes client not installed"
         return result
@@ -45,52 +169,45 @@ def test_connection(
             "namespaces": [],
         }
         if connection_method == "in_cluster":
-            config.load_incluster_config()
+            api_client = get_api_client(in_cluster=True)
         else:
-            raw = (kubeconfig_path or os.environ.get("KUBECONFIG") or os.environ.get("K8S_KUBECONFIG_PATH") or "").strip()
+            raw = (kubeconfig_path or os.environ.get("KUBECONFIG") or K8S_KUBECONFIG_PATH).strip()
             if not raw:
                 raw = "~/.kube/config"
             path = os.path.expanduser(raw)
             # When running in Docker, stored path (e.g. ~/.kube/config) often missing; use mounted config
-            env_path = os.environ.get("K8S_KUBECONFIG_PATH", "").strip()
-            if (not path or not os.path.isfile(path)) and env_path and os.path.isfile(env_path):
-                path = env_path
+            path_ok = bool(path) and _isfile(path)
+            if not path_ok and K8S_KUBECONFIG_PATH and _isfile(K8S_KUBECONFIG_PATH):
+                path, path_ok = K8S_KUBECONFIG_PATH, True
                 logger.info("Using K8S_KUBECONFIG_PATH for cluster test: %s", path)
-            if not path or not os.path.isfile(path):
+            if not path_ok:
                 raise FileNotFoundError(f"Kubeconfig not found: {path or raw}")
-            config.load_kube_config(config_file=path, context=context_name or None)
-        v1 = client.CoreV1Api()
-        nodes = v1.list_node()
-        out["node_count"] = len(nodes.items) if nodes.items else 0
-        ns_list = v1.list_namespace()
+            api_client = get_api_client(path, context_name)
+        v1 = client.CoreV1Api(api_client)
+        # Raw JSON lists (no V1Node/V1Namespace model hydration). Nodes: one item plus the
+        # server's remainingItemCount is enough to count them.
+        nodes = _list_raw(v1.api_client, "/api/v1/nodes", limit=1)
+        out["node_count"] = len(nodes.get("items") or []) + int(
+            (nodes.get("metadata") or {}).get("remainingItemCount") or 0
+        )
+        ns_list = _list_raw(v1.api_client, "/api/v1/namespaces", limit=NAMESPACE_LIST_LIMIT)
         out["namespaces"] = [
-            (item.metadata.name or "")
-            for item in (ns_list.items or [])
-            if item.metadata and item.metadata.name
+            name
+            for item in (ns_list.get("items") or [])
+            if (name := (item.get("metadata") or {}).get("name"))
         ]
-        try:
-            version_resp = v1.api_client.call_api(
-                "/version",
-                "GET",
-                auth_settings=["BearerToken"],
-                response_type="object",
-            )
-            if version_resp and isinstance(version_resp[0], dict):
-                git_version = (version_resp[0].get("gitVersion") or "")[:50]
-                if git_version:
-                    out["server_version"] = git_version
-        except Exception:
-            out["server_version"] = "unknown"
+        out["server_version"] = _server_version(v1.api_client)
         return out
 
     try:
-        with ThreadPoolExecutor(max_workers=1) as ex:
-            future = ex.submit(_run)
-            try:
-                data = future.result(timeout=5)
-            except FuturesTimeoutError:
-                result["error"] = "connection timeout (5s)"
-                return result
+        future = _test_executor.submit(_run)
+        try:
+            data = future.result(timeout=5)
+        except FuturesTimeoutError:
+            # The worker is not blocked for long: every API call has K8S_REQUEST_TIMEOUT.
+            future.cancel()
+            result["error"] = "connection timeout (5s)"
+            return result
         result["connected"] = True
         result["node_count"] = data.get("node_count", 0)
         result["server_version"] = data.get("server_version", "") or "unknown"
@@ -101,3 +218,62 @@ def test_connection(
         logger.exception("test_connection failed")
         result["error"] = str(e) or "connection refused"
     return result
+
+
+# Successful connection tests are reused for CLUSTER_TEST_CACHE_SECONDS so namespace
+# lookups and repeated "test" clicks don't redo TLS + API discovery every time.
+CLUSTER_TEST_CACHE_SECONDS = int(os.environ.get("CLUSTER_TEST_CACHE_SECONDS", "60"))
+
+
+def _test_cache_key(cluster_id: int) -> str:
+    return f"cluster_test:{cluster_id}"
+
+
+def cached_test_connection(
+    cluster_id: int,
+    connection_method: str,
+    kubeconfig_path: str = "",
+    context_name: str = "",
+    force: bool = False,
+) -> tuple[dict[str, Any], bool]:
+    """
+    test_connection with a short-TTL cache of successful results per cluster.
+    The entry is ignored if the cluster's method/kubeconfig/context changed.
+    Returns (result, cached).
+    """
+    key = _test_cache_key(cluster_id)
+    fingerprint = (connection_method, kubeconfig_path, context_name)
+    if not force and CLUSTER_TEST_CACHE_SECONDS > 0:
+        hit = cache.get(key)
+        if hit and tuple(hit.get("fingerprint") or ()) == fingerprint:
+            return hit["result"], True
+    result = test_connection(connection_method, kubeconfig_path, context_name)
+    if result.get("connected") and CLUSTER_TEST_CACHE_SECONDS > 0:
+        cache.set(
+            key,
+            {"fingerprint": fingerprint, "result": result},
+            timeout=CLUSTER_TEST_CACHE_SECONDS,
+        )
+    else:
+        cache.delete(key)
+    return result, False
+
+
+def cached_test_connections(
+    targets: list[tuple[int, str, str, str]],
+    force: bool = False,
+) -> list[tuple[dict[str, Any], bool]]:
+    """
+    cached_test_connection for many (cluster_id, method, kubeconfig_path, context) targets
+    at once; wall time is about the slowest cluster, not the sum. Results keep input order.
+    """
+    futures = [
+        _test_all_executor.submit(cached_test_connection, cid, method, path, ctx, force)
+        for cid, method, path, ctx in targets
+    ]
+    return [f.result() for f in futures]
+
+
+def invalidate_test_connection(cluster_id: int) -> None:
+    """Drop the cached connection test for a cluster (kubeconfig rewritten, watcher restarted)."""
+    cache.delete(_test_cache_key(cluster_id))
@@ -4,8 +4,11 @@ from rest_framework import serializers
 from .models import ClusterConnection
 
 
-VALID_CONNECTION_METHODS = {c.value for c in ClusterConnection.ConnectionMethod}
-VALID_ENVIRONMENTS = {e.value for e in ClusterConnection.Environment}
+VALID_CONNECTION_METHODS = frozenset(c.value for c in ClusterConnection.ConnectionMethod)
+VALID_ENVIRONMENTS = frozenset(e.value for e in ClusterConnection.Environment)
+# Validation error suffixes, joined once rather than on every rejected request.
+_VALID_METHODS_STR = ", ".join(sorted(VALID_CONNECTION_METHODS))
+_VALID_ENVIRONMENTS_STR = ", ".join(sorted(VALID_ENVIRONMENTS))
 
 
 class ClusterConnectionSerializer(serializers.ModelSerializer):
@@ -51,7 +54,7 @@ class ClusterConnectionSerializer(serializers.ModelSerializer):
     def validate_connection_method(self, value: str) -> str:
         if not value or value not in VALID_CONNECTION_METHODS:
             raise serializers.ValidationError(
-                f"connection_method must be one of: {', '.join(sorted(VALID_CONNECTION_METHODS))}."
+                f"connection_method must be one of: {_VALID_METHODS_STR}."
             )
         return value.strip()
 
@@ -60,7 +63,7 @@ class ClusterConnectionSerializer(serializers.ModelSerializer):
             return ClusterConnection.Environment.DEV
         if not isinstance(value, str) or value not in VALID_ENVIRONMENTS:
             raise serializers.ValidationError(
-                f"environment must be one of: {', '.join(sorted(VALID_ENVIRONMENTS))}."
+                f"environment must be one of: {_VALID_ENVIRONMENTS_STR}."
             )
         return value.strip()
 
@@ -1,13 +1,16 @@
 """API views for cluster connection: CRUD, test, connect, namespaces."""
+import hashlib
+import json
 import logging
 
 from django.utils import timezone
+from django.utils.http import parse_etags, quote_etag
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
-from .k8s_client import test_connection
+from .k8s_client import cached_test_connection, cached_test_connections, invalidate_test_connection
 from .models import ClusterConnection
 from .serializers import ClusterConnectionSerializer
 from .watcher_manager import write_cluster_kubeconfig, start_watcher, stop_watcher, watcher_status
@@ -15,6 +18,45 @@ from .watcher_manager import write_cluster_kubeconfig, start_watcher, stop_watch
 logger = logging.getLogger(__name__)
 
 
+def _etag_response(request, data: dict, cache_control: str) -> Response:
+    """
+    Response with an ETag over the JSON body; 304 (no body) when If-None-Match matches.
+    Weak (W/) validators match too, since proxies weaken ETags when they compress.
+    """
+    digest = hashlib.blake2b(
+        json.dumps(data, sort_keys=True, separators=(",", ":")).encode(), digest_size=8
+    ).hexdigest()
+    etag = quote_etag(digest)
+    client_etags = {
+        e.removeprefix("W/") for e in parse_etags(request.headers.get("If-None-Match", ""))
+    }
+    if etag in client_etags or "*" in client_etags:
+        resp = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        resp = Response(data)
+    resp["ETag"] = etag
+    resp["Cache-Control"] = cache_control
+    return resp
+
+
+def _record_test_result(cluster_pk: int, result: dict) -> None:
+    """Persist a connection test outcome with a single UPDATE (no save() signals)."""
+    rows = ClusterConnection.objects.filter(pk=cluster_pk)
+    if result.get("connected"):
+        rows.update(
+            status=ClusterConnection.Status.CONNECTED,
+            node_count=result.get("node_count", 0),
+            server_version=(result.get("server_version") or "")[:50],
+            last_connected=timezone.now(),
+            error_message="",
+        )
+    else:
+        rows.update(
+            status=ClusterConnection.Status.FAILED,
+            error_message=result.get("error", "Unknown error")[:2000],
+        )
+
+
 class ClusterConnectionViewSet(ModelViewSet):
     """CRUD + test, connect, namespaces for ClusterConnection."""
 
@@ -22,6 +64,24 @@ class ClusterConnectionViewSet(ModelViewSet):
     serializer_class = ClusterConnectionSerializer
     http_method_names = ["get", "post", "patch", "delete", "head", "options"]
 
+    # Columns the test/connect/namespaces/start-watcher actions read; everything else
+    # (error_message text, version, timestamps) is serializer-only.
+    _ACTION_FIELDS = (
+        "id",
+        "name",
+        "connection_method",
+        "kubeconfig_path",
+        "context_name",
+        "namespaces",
+    )
+
+    def get_queryset(self):
+        """Full rows for CRUD; a narrow projection for the connectivity actions."""
+        qs = super().get_queryset()
+        if self.action in ("test", "test_all", "connect", "namespaces", "start_watcher_action"):
+            return qs.only(*self._ACTION_FIELDS)
+        return qs
+
     def create(self, request, *args, **kwargs) -> Response:
         """Create cluster; if kubeconfig_content is provided, save to file and set kubeconfig_path."""
         content = (request.data.get("kubeconfig_content") or "").strip()
@@ -50,6 +110,7 @@ class ClusterConnectionViewSet(ModelViewSet):
                 )
                 cluster.kubeconfig_path = str(path)
                 cluster.save(update_fields=["kubeconfig_path"])
+                invalidate_test_connection(cluster.id)
             except Exception as e:
                 logger.exception("Failed to write kubeconfig for cluster %s: %s", cluster.id, e)
                 return Response(
@@ -64,37 +125,58 @@ class ClusterConnectionViewSet(ModelViewSet):
         """
         Test connectivity for this cluster. Uses kubeconfig path from model.
         Returns {connected, node_count, server_version, namespaces} or {connected: false, error}.
+        A recent successful test is reused; ?force=1 always re-tests.
         """
         cluster = self.get_object()
-        result = test_connection(
+        result, cached = cached_test_connection(
+            cluster.id,
             connection_method=cluster.connection_method,
             kubeconfig_path=cluster.kubeconfig_path or "",
             context_name=cluster.context_name or "",
+            force=request.query_params.get("force") == "1",
         )
-        if result.get("connected"):
-            cluster.status = ClusterConnection.Status.CONNECTED
-            cluster.node_count = result.get("node_count", 0)
-            cluster.server_version = (result.get("server_version") or "")[:50]
-            cluster.last_connected = timezone.now()
-            cluster.error_message = ""
-            cluster.save(update_fields=["status", "node_count", "server_version", "last_connected", "error_message"])
-        else:
-            cluster.status = ClusterConnection.Status.FAILED
-            cluster.error_message = result.get("error", "Unknown error")[:2000]
-            cluster.save(update_fields=["status", "error_message"])
+        # The response is the test result, not the row. A cached result was recorded when it
+        # was computed; re-recording would bump last_connected without contacting the cluster.
+        if not cached:
+            _record_test_result(cluster.pk, result)
         return Response(result)
 
+    @action(detail=False, methods=["post"], url_path="test-all")
+    def test_all(self, request) -> Response:
+        """
+        Test every cluster concurrently (same caching and ?force=1 as test).
+        Returns [{cluster_id, name, cached, connected, ...}] in list order.
+        """
+        clusters = list(self.get_queryset())
+        results = cached_test_connections(
+            [
+                (c.id, c.connection_method, c.kubeconfig_path or "", c.context_name or "")
+                for c in clusters
+            ],
+            force=request.query_params.get("force") == "1",
+        )
+        payload = []
+        for cluster, (result, cached) in zip(clusters, results):
+            if not cached:
+                _record_test_result(cluster.pk, result)
+            payload.append(
+                {"cluster_id": cluster.id, "name": cluster.name, "cached": cached, **result}
+            )
+        return Response(payload)
+
     @action(detail=True, methods=["post"])
     def connect(self, request, pk=None) -> Response:
         """
-        Mark cluster as watching and start the watcher subprocess (no manual step).
+        Mark cluster as watching and start its in-process watcher threads (no manual step).
         Updates status to WATCHING and returns success.
         """
         cluster = self.get_object()
-        cluster.status = ClusterConnection.Status.WATCHING
-        cluster.last_connected = timezone.now()
-        cluster.error_message = ""
-        cluster.save(update_fields=["status", "last_connected", "error_message"])
+        invalidate_test_connection(cluster.id)
+        ClusterConnection.objects.filter(pk=cluster.pk).update(
+            status=ClusterConnection.Status.WATCHING,
+            last_connected=timezone.now(),
+            error_message="",
+        )
         namespaces = cluster.namespaces or ["default"]
         result = start_watcher(cluster.id, namespaces)
         if not result.get("started") and result.get("error"):
@@ -114,6 +196,7 @@ class ClusterConnectionViewSet(ModelViewSet):
     def start_watcher_action(self, request, pk=None) -> Response:
         """Start or restart the watcher for this cluster (activates its kubeconfig)."""
         cluster = self.get_object()
+        invalidate_test_connection(cluster.id)
         namespaces = cluster.namespaces or ["default"]
         result = start_watcher(cluster.id, namespaces)
         if result.get("started"):
@@ -131,7 +214,9 @@ class ClusterConnectionViewSet(ModelViewSet):
     @action(detail=False, methods=["get"], url_path="watcher/status")
     def watcher_status_action(self, request) -> Response:
         """Return {running: bool, cluster_id?: int}."""
-        return Response(watcher_status())
+        # Polled by the UI: revalidate every time (status must flip right after start/stop),
+        # but an unchanged status costs a bodiless 304.
+        return _etag_response(request, watcher_status(), "private, no-cache")
 
     @action(detail=False, methods=["get"], url_path="security-info")
     def security_info(self, request) -> Response:
@@ -166,15 +251,21 @@ class ClusterConnectionViewSet(ModelViewSet):
         """
         List available namespaces in the cluster (from last successful test or cached).
         If not yet tested, runs test first and returns namespaces from that.
+        ?force=1 bypasses the cached test.
         """
         cluster = self.get_object()
-        result = test_connection(
+        result, _cached = cached_test_connection(
+            cluster.id,
             connection_method=cluster.connection_method,
             kubeconfig_path=cluster.kubeconfig_path or "",
             context_name=cluster.context_name or "",
+            force=request.query_params.get("force") == "1",
         )
         if result.get("connected"):
-            return Response({"namespaces": result.get("namespaces", [])})
+            # Polled by the UI: the browser reuses it for 5s, then revalidates by ETag.
+            return _etag_response(
+                request, {"namespaces": result.get("namespaces", [])}, "private, max-age=5"
+            )
         return Response(
             {"error": result.get("error", "Connection failed"), "namespaces": []},
             status=status.HTTP_400_BAD_REQUEST,
@@ -1,11 +1,13 @@
 """
-Manages the in-process watcher subprocess (run_watcher).
+Manages the in-process cluster watchers (one Kubernetes watch thread per namespace).
 Used when the user starts watching from the UI so no manual docker/terminal is needed.
 NEVER logs or stores kubeconfig content — only file paths.
 
 Watcher state is persisted to a PID file so that status and stop work correctly when
 the API is served by multiple workers (e.g. gunicorn); the worker that started the
-watcher holds the process handle, but any worker can report status or stop via the file.
+watcher owns its threads, but any worker can report status or stop via the file: a
+thread-mode file carries a token, and the threads exit once the file no longer holds it.
+Files without a token belong to a standalone `manage.py run_watcher` process.
 """
 import json
 import logging
@@ -13,19 +15,32 @@ import os
 import re
 import shutil
 import signal
-import subprocess
-import sys
 import threading
+import time
+import uuid
 from pathlib import Path
 from typing import Any
 
+import yaml
+
 logger = logging.getLogger(__name__)
 
-# Multiple watcher processes keyed by cluster_id; guarded by _lock so that
-# concurrent API workers don't race to start/stop the same watcher.
-_watcher_processes: dict[int, subprocess.Popen] = {}
+# Watcher threads keyed by cluster_id: (stop event, one daemon thread per namespace).
+# Guarded by _lock so that concurrent requests don't race to start/stop the same watcher.
+_watcher_threads: dict[int, tuple[threading.Event, list[threading.Thread]]] = {}
 _lock = threading.Lock()
 
+# Each watch request ends after this many seconds and is reissued from the last seen
+# resourceVersion (no re-list); also bounds how long a stopped thread takes to exit.
+WATCHER_THREAD_WATCH_TIMEOUT = int(os.environ.get("WATCHER_THREAD_WATCH_TIMEOUT", "60"))
+WATCHER_MAX_BACKOFF = 60
+# Process environment the watcher depends on, read once at import rather than per start.
+K8S_IN_CLUSTER = os.environ.get("K8S_IN_CLUSTER", "false").lower() in ("true", "1", "yes")
+# How often a watch thread re-reads its PID file to notice a stop from another worker.
+WATCHER_OWNERSHIP_CHECK_SECONDS = 5.0
+# A standalone run_watcher process gets this long after SIGTERM before SIGKILL.
+WATCHER_STOP_GRACE_SECONDS = 5.0
+
 # Paths (container defaults). Use a writable path for active config so we don't write to
 # a read-only mount (e.g. docker-compose mounts ./kubeconfig at /app/.kube/config:ro).
 KUBECONFIGS_DIR = Path(os.environ.get("KUBEMEMORY_KUBECONFIGS_DIR", "/app/kubeconfigs"))
@@ -33,6 +48,21 @@ ACTIVE_KUBECONFIG_PATH = Path(os.environ.get("KUBEMEMORY_ACTIVE_KUBECONFIG") or
 # Legacy single-watcher PID path (used when cluster_id is unknown/None).
 WATCHER_PID_FILE = KUBECONFIGS_DIR / "watcher.pid"
 
+# Kubeconfig rewriting patterns (compiled once; used on every pasted kubeconfig).
+_RE_CURRENT_CTX = re.compile(r"current-context:\s*(\S+)")
+_RE_CLUSTERS_NAME = re.compile(r"clusters:\s*\n\s*-\s*cluster:.*?name:\s*(\S+)", re.DOTALL)
+_RE_SERVER_URL = re.compile(r"server:\s*https?://[^\s\n]+")
+_RE_SERVER_LINE = re.compile(r"(?m)^([ \t]*server:.*)$")
+_RE_DOCKER_HOST_SERVER_LINE = re.compile(r"(?m)^([ \t]*server:.*host\.docker\.internal.*)$")
+# Loopback/any-address hosts rewritten to host.docker.internal in one pass; whole addresses
+# only (e.g. not the 127.0.0.1 prefix of 127.0.0.10).
+_RE_LOCAL_IP = re.compile(r"\b(?:127\.0\.0\.1|0\.0\.0\.0)\b")
+_INSECURE_SKIP_TLS = r"\1\n    insecure-skip-tls-verify: true"
+
+# libyaml-backed loader/dumper when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def _ensure_kubeconfigs_dir() -> None:
     """Ensure KUBECONFIGS_DIR exists (for per-cluster stored configs)."""
@@ -66,19 +96,22 @@ def _read_watcher_pid_file(cluster_id: int | None = None) -> dict[str, Any] | No
         cluster_id = data.get("cluster_id")
         if pid is None or not isinstance(pid, int):
             return None
-        return {"pid": pid, "cluster_id": cluster_id}
+        return {"pid": pid, "cluster_id": cluster_id, "token": data.get("token")}
     except (json.JSONDecodeError, OSError):
         return None
 
 
-def _write_watcher_pid_file(pid: int, cluster_id: int | None) -> None:
-    """Write watcher PID and cluster_id to file so any worker can report status."""
+def _write_watcher_pid_file(pid: int, cluster_id: int | None, token: str | None = None) -> None:
+    """
+    Write watcher PID and cluster_id to file so any worker can report status.
+    token marks an in-process (thread) watcher owned by process pid.
+    """
     _ensure_kubeconfigs_dir()
     path = _pid_file_for(cluster_id)
-    path.write_text(
-        json.dumps({"pid": pid, "cluster_id": cluster_id}, indent=0),
-        encoding="utf-8",
-    )
+    data: dict[str, Any] = {"pid": pid, "cluster_id": cluster_id}
+    if token:
+        data["token"] = token
+    path.write_text(json.dumps(data, indent=0), encoding="utf-8")
 
 
 def _remove_watcher_pid_file(cluster_id: int | None) -> None:
@@ -103,13 +136,13 @@ def _kind_cluster_name_from_kubeconfig(content: str) -> str | None:
     and the control-plane container is '<name>-control-plane'. Returns None if not detected.
     """
     # current-context: kind-demo or kind-kubememory-prod-sim
-    match = re.search(r"current-context:\s*(\S+)", content)
+    match = _RE_CURRENT_CTX.search(content)
     if match:
         ctx = match.group(1).strip()
         if ctx.startswith("kind-"):
             return ctx[5:].strip() or None  # strip "kind-" prefix
     # Fallback: cluster name in clusters block often matches (e.g. kind-demo)
-    match = re.search(r"clusters:\s*\n\s*-\s*cluster:.*?name:\s*(\S+)", content, re.DOTALL)
+    match = _RE_CLUSTERS_NAME.search(content)
     if match:
         name = match.group(1).strip()
         if name.startswith("kind-"):
@@ -117,6 +150,47 @@ def _kind_cluster_name_from_kubeconfig(content: str) -> str | None:
     return None
 
 
+def _kind_cluster_name_from_config(cfg: dict[str, Any]) -> str | None:
+    """_kind_cluster_name_from_kubeconfig for an already-parsed kubeconfig."""
+    clusters = cfg.get("clusters") or []
+    first_cluster = clusters[0].get("name") if clusters and isinstance(clusters[0], dict) else None
+    for name in (cfg.get("current-context"), first_cluster):
+        if isinstance(name, str) and name.strip().startswith("kind-"):
+            return name.strip()[5:].strip() or None
+    return None
+
+
+def _load_kubeconfig(content: str) -> dict[str, Any] | None:
+    """Parse kubeconfig YAML (libyaml C loader when available); None if it isn't a kubeconfig."""
+    try:
+        cfg = yaml.load(content, Loader=_YAML_LOADER)
+    except yaml.YAMLError:
+        return None
+    if not isinstance(cfg, dict):
+        return None
+    clusters = cfg.get("clusters")
+    if not isinstance(clusters, list) or not all(
+        isinstance(c, dict) and isinstance(c.get("cluster"), dict) for c in clusters
+    ):
+        return None
+    return cfg
+
+
+def _rewrite_kubeconfig_text(
+    text: str, use_docker_host: bool, kind_server: str | None
+) -> str:
+    """Regex fallback for write_cluster_kubeconfig when the content doesn't parse as YAML."""
+    if kind_server:
+        text = _RE_SERVER_URL.sub(f"server: {kind_server}", text, count=1)
+        if "insecure-skip-tls-verify" not in text:
+            text = _RE_SERVER_LINE.sub(_INSECURE_SKIP_TLS, text)
+    elif use_docker_host:
+        text = _RE_LOCAL_IP.sub("host.docker.internal", text)
+        if "insecure-skip-tls-verify" not in text and "host.docker.internal" in text:
+            text = _RE_DOCKER_HOST_SERVER_LINE.sub(_INSECURE_SKIP_TLS, text)
+    return text
+
+
 def write_cluster_kubeconfig(
     cluster_id: int,
     content: str,
@@ -128,62 +202,92 @@ def write_cluster_kubeconfig(
     Write kubeconfig content to the cluster's file.
 
     - If use_docker_host is True (and not use_kind_network): replace 127.0.0.1/0.0.0.0
-      with host.docker.internal and add insecure-skip-tls-verify. Works when the cluster
-      API is bound to 0.0.0.0 so the host can be reached from the container.
+      in server URLs with host.docker.internal and add insecure-skip-tls-verify. Works
+      when the cluster API is bound to 0.0.0.0 so the host can be reached from the container.
 
     - If use_kind_network is True: rewrite server to https://<name>-control-plane:6443
       so the app (when attached to the Kind Docker network) talks to the control-plane
       container directly. No need to recreate the cluster with 0.0.0.0. kind_cluster_name
       can be provided or inferred from current-context (e.g. kind-demo -> demo).
 
+    The kubeconfig is parsed once and edited as data; content that isn't valid YAML
+    falls back to text rewriting.
+
     Returns the path written.
     """
     _ensure_kubeconfigs_dir()
     path = get_cluster_kubeconfig_path(cluster_id)
     text = content
 
-    if use_kind_network:
-        name = (kind_cluster_name or "").strip() or _kind_cluster_name_from_kubeconfig(content)
-        if not name:
-            # Fallback: use a safe default so we at least write something
-            name = "kind"
-        host = f"{name}-control-plane"
-        server = f"https://{host}:6443"
-        # Replace server: https://... with our Kind control-plane URL
-        text = re.sub(
-            r"server:\s*https?://[^\s\n]+",
-            f"server: {server}",
-            text,
-            count=1,
-        )
-        # Ensure insecure-skip-tls-verify (Kind cert is for localhost/127.0.0.1)
-        if "insecure-skip-tls-verify" not in text:
-            lines = text.split("\n")
-            out = []
-            for line in lines:
-                out.append(line)
-                if re.match(r"\s*server:\s*", line):
-                    out.append("    insecure-skip-tls-verify: true")
-            text = "\n".join(out)
-    elif use_docker_host:
-        text = text.replace("127.0.0.1", "host.docker.internal").replace(
-            "0.0.0.0", "host.docker.internal"
-        )
-        if "insecure-skip-tls-verify" not in text and "host.docker.internal" in text:
-            lines = text.split("\n")
-            out = []
-            for line in lines:
-                out.append(line)
-                if line.strip().startswith("server:") and "host.docker.internal" in line:
-                    out.append("    insecure-skip-tls-verify: true")
-            text = "\n".join(out)
-    path.write_text(text, encoding="utf-8")
+    if use_kind_network or use_docker_host:
+        cfg = _load_kubeconfig(content)
+        kind_server = None
+        if use_kind_network:
+            name = (kind_cluster_name or "").strip() or (
+                _kind_cluster_name_from_config(cfg)
+                if cfg is not None
+                else _kind_cluster_name_from_kubeconfig(content)
+            )
+            if not name:
+                # Fallback: use a safe default so we at least write something
+                name = "kind"
+            kind_server = f"https://{name}-control-plane:6443"
+
+        if cfg is None:
+            text = _rewrite_kubeconfig_text(content, use_docker_host, kind_server)
+        else:
+            for i, entry in enumerate(cfg["clusters"]):
+                cluster = entry["cluster"]
+                server = str(cluster.get("server") or "")
+                if kind_server:
+                    if i == 0:
+                        cluster["server"] = kind_server
+                    # Kind's cert is for localhost/127.0.0.1
+                    cluster.setdefault("insecure-skip-tls-verify", True)
+                else:
+                    server = _RE_LOCAL_IP.sub("host.docker.internal", server)
+                    cluster["server"] = server
+                    if "host.docker.internal" in server:
+                        cluster.setdefault("insecure-skip-tls-verify", True)
+            text = yaml.dump(
+                cfg, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False
+            )
+    _atomic_write_text(path, text)
     return path
 
 
+def _atomic_write_text(path: Path, text: str) -> None:
+    """
+    Write via a temp file + os.replace. The active kubeconfig may be a symlink to this path,
+    so an in-place write would let a reader see a truncated file.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _copy_file(src: Path, dest: Path) -> None:
+    """Copy via os.sendfile (no userspace buffer); shutil where sendfile can't target files."""
+    try:
+        with open(src, "rb") as s, open(dest, "wb") as d:
+            size = os.fstat(s.fileno()).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(d.fileno(), s.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+    except (AttributeError, OSError):
+        shutil.copyfile(src, dest)
+
+
 def activate_cluster_config(cluster_id: int, namespaces: list[str]) -> bool:
     """
-    Copy the cluster's kubeconfig to the writable active path and return True if the file existed.
+    Link (or copy) the cluster's kubeconfig to the writable active path; True if it existed.
     Does not start the watcher; call start_watcher after this.
     """
     src = get_cluster_kubeconfig_path(cluster_id)
@@ -192,78 +296,219 @@ def activate_cluster_config(cluster_id: int, namespaces: list[str]) -> bool:
         return False
     dest = ACTIVE_KUBECONFIG_PATH
     _ensure_kubeconfigs_dir()  # ensure dest.parent exists and is writable
-    shutil.copy2(src, dest)
+    # Point the active path at the cluster's file: a symlink (no data copied), or a
+    # kernel-side sendfile copy where symlinks aren't allowed; os.replace swaps it in
+    # atomically. write_cluster_kubeconfig also replaces rather than rewrites, so readers
+    # never see a half-written config; a re-pasted kubeconfig for the active cluster shows
+    # up at the active path (a running standalone watcher keeps the config it loaded).
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+    try:
+        tmp.unlink(missing_ok=True)
+        try:
+            os.symlink(src.resolve(), tmp)
+        except OSError:
+            _copy_file(src, tmp)
+        os.replace(tmp, dest)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
     logger.info("Activated kubeconfig for cluster %s -> %s", cluster_id, dest)
     return True
 
 
+def _new_watcher_api_client(cluster_id: int) -> Any:
+    """Pooled ApiClient for a cluster's watch threads (shared with its connection tests)."""
+    from .k8s_client import get_api_client
+
+    if K8S_IN_CLUSTER:
+        return get_api_client(in_cluster=True)
+    return get_api_client(str(get_cluster_kubeconfig_path(cluster_id)))
+
+
+def _owns_pid_file(cluster_id: int, token: str) -> bool:
+    """True while this cluster's PID file still names this thread-mode watcher."""
+    pid_data = _read_watcher_pid_file(cluster_id)
+    return bool(pid_data) and pid_data.get("token") == token
+
+
+def _run_watcher_loop(
+    cluster_id: int,
+    namespace: str,
+    api_client: Any,
+    stop_event: threading.Event,
+    token: str,
+) -> None:
+    """Thread body: watch one namespace until stopped here or via the PID file elsewhere."""
+    from kubernetes import client
+    from kubernetes.client.rest import ApiException
+
+    from apps.watcher.events import watch_namespace
+
+    v1 = client.CoreV1Api(api_client)
+
+    # The PID file is re-read at most every WATCHER_OWNERSHIP_CHECK_SECONDS, not per event.
+    next_ownership_check = 0.0
+
+    def should_stop() -> bool:
+        nonlocal next_ownership_check
+        if stop_event.is_set():
+            return True
+        now = time.monotonic()
+        if now < next_ownership_check:
+            return False
+        next_ownership_check = now + WATCHER_OWNERSHIP_CHECK_SECONDS
+        return not _owns_pid_file(cluster_id, token)
+
+    resource_version: str | None = None
+    backoff = 1
+    while not should_stop():
+        try:
+            resource_version = watch_namespace(
+                v1,
+                namespace,
+                WATCHER_THREAD_WATCH_TIMEOUT,
+                cluster_id=cluster_id,
+                should_stop=should_stop,
+                resource_version=resource_version,
+            )
+            backoff = 1
+        except ApiException as e:
+            logger.warning(
+                "K8s API error for cluster %s namespace %s: %s", cluster_id, namespace, e
+            )
+            stop_event.wait(backoff)
+            backoff = min(backoff * 2, WATCHER_MAX_BACKOFF)
+        except Exception as e:
+            logger.exception(
+                "Watcher error for cluster %s namespace %s: %s", cluster_id, namespace, e
+            )
+            stop_event.wait(backoff)
+            backoff = min(backoff * 2, WATCHER_MAX_BACKOFF)
+    logger.info("Watcher thread for cluster %s namespace %s exited", cluster_id, namespace)
+
+
+def _pid_file_watcher_alive(cluster_id: int | None, pid_data: dict[str, Any]) -> bool:
+    """
+    Whether the watcher a PID file names is still running. A thread-mode file carrying this
+    process's own PID (e.g. Daphne as PID 1 after a container restart) is live only if this
+    process actually runs the threads; otherwise it is a leftover.
+    """
+    if pid_data.get("token") and pid_data["pid"] == os.getpid():
+        return cluster_id is not None and _local_watcher_running(cluster_id)
+    return _is_process_alive(pid_data["pid"])
+
+
+def _stop_pid_file_watcher(cluster_id: int | None) -> bool:
+    """
+    Stop a watcher known only from its PID file. Thread-mode watchers (token) are stopped by
+    removing the file; only a standalone run_watcher process is signalled.
+    """
+    pid_data = _read_watcher_pid_file(cluster_id)
+    if not pid_data:
+        return False
+    if not _pid_file_watcher_alive(cluster_id, pid_data):
+        _remove_watcher_pid_file(cluster_id)
+        return False
+    if not pid_data.get("token"):
+        _terminate_process(pid_data["pid"])
+    _remove_watcher_pid_file(cluster_id)
+    return True
+
+
+def _terminate_process(pid: int) -> None:
+    """
+    SIGTERM a standalone watcher and return at once; a daemon thread polls for exit and
+    SIGKILLs it after WATCHER_STOP_GRACE_SECONDS (its watch read can block for minutes).
+    Callers hold _lock, so nothing here waits on the process.
+    """
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        return
+    threading.Thread(
+        target=_kill_if_still_alive, args=(pid,), name=f"watcher-reaper-{pid}", daemon=True
+    ).start()
+
+
+def _kill_if_still_alive(pid: int) -> None:
+    deadline = time.monotonic() + WATCHER_STOP_GRACE_SECONDS
+    while time.monotonic() < deadline:
+        if not _is_process_alive(pid):
+            return
+        time.sleep(0.05)
+    try:
+        os.kill(pid, signal.SIGKILL)
+        logger.warning("Watcher process %s ignored SIGTERM; killed", pid)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _local_watcher_running(cluster_id: int) -> bool:
+    entry = _watcher_threads.get(cluster_id)
+    if entry is None:
+        return False
+    stop_event, threads = entry
+    return not stop_event.is_set() and any(t.is_alive() for t in threads)
+
+
 def start_watcher(cluster_id: int, namespaces: list[str]) -> dict[str, Any]:
     """
-    Activate this cluster's kubeconfig and start the watcher subprocess (or restart with new config).
+    Activate this cluster's kubeconfig and start its watch threads (or restart with new config).
     namespaces: list of namespace names to watch.
     Writes PID to a per-cluster file so watcher_status/stop work from any API worker.
     Returns {started: bool, error?: str}.
     """
     with _lock:
         # Stop any existing watcher for this cluster (in this worker or another).
-        existing = _watcher_processes.get(cluster_id)
-        if existing is not None and existing.poll() is None:
-            existing.terminate()
-            existing.wait(timeout=10)
-            _watcher_processes.pop(cluster_id, None)
-            _remove_watcher_pid_file(cluster_id)
-        else:
-            # Watcher may have been started by another API worker; stop via PID file.
-            pid_data = _read_watcher_pid_file(cluster_id)
-            if pid_data and _is_process_alive(pid_data["pid"]):
-                try:
-                    os.kill(pid_data["pid"], signal.SIGTERM)
-                except (ProcessLookupError, PermissionError):
-                    pass
-                _remove_watcher_pid_file(cluster_id)
+        if not _stop_local_watcher(cluster_id):
+            _stop_pid_file_watcher(cluster_id)
         if not activate_cluster_config(cluster_id, namespaces):
             return {"started": False, "error": "Cluster kubeconfig file not found. Use paste kubeconfig or provide path."}
-        env = os.environ.copy()
-        env["K8S_KUBECONFIG_PATH"] = str(ACTIVE_KUBECONFIG_PATH)
-        env["K8S_NAMESPACES"] = ",".join(namespaces) if namespaces else "default"
-        env["K8S_CLUSTER_ID"] = str(cluster_id)
         try:
-            # Use writable dir that contains manage.py (e.g. /app in Docker, or backend/ locally)
-            cwd = Path("/app") if Path("/app/manage.py").exists() else Path(os.getcwd())
-            proc = subprocess.Popen(
-                [sys.executable, "manage.py", "run_watcher"],
-                cwd=str(cwd),
-                env=env,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE,
-            )
-            _watcher_processes[cluster_id] = proc
-            _write_watcher_pid_file(proc.pid, cluster_id)
+            api_client = _new_watcher_api_client(cluster_id)
+            token = uuid.uuid4().hex
+            _write_watcher_pid_file(os.getpid(), cluster_id, token)
+            stop_event = threading.Event()
+            threads = [
+                threading.Thread(
+                    target=_run_watcher_loop,
+                    args=(cluster_id, namespace, api_client, stop_event, token),
+                    name=f"k8s-watch-{cluster_id}-{namespace}",
+                    daemon=True,
+                )
+                for namespace in (namespaces or ["default"])
+            ]
+            for thread in threads:
+                thread.start()
+            _watcher_threads[cluster_id] = (stop_event, threads)
             logger.info("Started watcher for cluster %s, namespaces %s", cluster_id, namespaces)
             return {"started": True}
         except Exception as e:
             logger.exception("Failed to start watcher: %s", e)
+            _remove_watcher_pid_file(cluster_id)
             return {"started": False, "error": str(e)}
 
 
+def _stop_local_watcher(cluster_id: int) -> bool:
+    """Signal this worker's threads for cluster_id to exit (they finish their current read)."""
+    entry = _watcher_threads.pop(cluster_id, None)
+    if entry is None:
+        return False
+    stop_event, threads = entry
+    running = not stop_event.is_set() and any(t.is_alive() for t in threads)
+    stop_event.set()
+    if running:
+        _remove_watcher_pid_file(cluster_id)
+    return running
+
+
 def _stop_watcher_for_cluster(cluster_id: int) -> bool:
     """Stop watcher for a specific cluster_id. Returns True if anything was stopped."""
     stopped = False
-    proc = _watcher_processes.get(cluster_id)
-    if proc is not None and proc.poll() is None:
-        proc.terminate()
-        proc.wait(timeout=10)
-        _watcher_processes.pop(cluster_id, None)
-        _remove_watcher_pid_file(cluster_id)
-        logger.info("Stopped watcher for cluster %s (local process)", cluster_id)
+    if _stop_local_watcher(cluster_id):
+        logger.info("Stopped watcher for cluster %s (local threads)", cluster_id)
         stopped = True
-    pid_data = _read_watcher_pid_file(cluster_id)
-    if pid_data and _is_process_alive(pid_data["pid"]):
-        try:
-            os.kill(pid_data["pid"], signal.SIGTERM)
-        except (ProcessLookupError, PermissionError):
-            pass
-        _remove_watcher_pid_file(cluster_id)
+    if _stop_pid_file_watcher(cluster_id):
         logger.info("Stopped watcher for cluster %s (via PID file)", cluster_id)
         stopped = True
     return stopped
@@ -271,7 +516,7 @@ def _stop_watcher_for_cluster(cluster_id: int) -> bool:
 
 def stop_watcher(cluster_id: int | None = None) -> dict[str, Any]:
     """
-    Stop watcher subprocess(es).
+    Stop watcher(s).
 
     If cluster_id is provided, stop only that cluster's watcher.
     If cluster_id is None, stop all known watchers.
@@ -283,7 +528,7 @@ def stop_watcher(cluster_id: int | None = None) -> dict[str, Any]:
 
         stopped_any = False
         # Stop all in-memory tracked watchers.
-        for cid in list(_watcher_processes.keys()):
+        for cid in list(_watcher_threads.keys()):
             if _stop_watcher_for_cluster(cid):
                 stopped_any = True
 
@@ -296,19 +541,11 @@ def stop_watcher(cluster_id: int | None = None) -> dict[str, Any]:
                 cid = int(cid_str)
             except ValueError:
                 continue
-            if cid in _watcher_processes:
-                continue
             if _stop_watcher_for_cluster(cid):
                 stopped_any = True
 
         # Legacy global watcher PID file (no cluster_id).
-        legacy = _read_watcher_pid_file(None)
-        if legacy and _is_process_alive(legacy["pid"]):
-            try:
-                os.kill(legacy["pid"], signal.SIGTERM)
-            except (ProcessLookupError, PermissionError):
-                pass
-            _remove_watcher_pid_file(None)
+        if _stop_pid_file_watcher(None):
             logger.info("Stopped legacy watcher (no cluster_id)")
             stopped_any = True
 
@@ -326,25 +563,21 @@ def watcher_status(cluster_id: int | None = None) -> dict[str, Any]:
     """
     with _lock:
         if cluster_id is not None:
-            # Check in-memory process first.
-            proc = _watcher_processes.get(cluster_id)
-            if proc is not None and proc.poll() is None:
+            # Check this worker's threads first.
+            if _local_watcher_running(cluster_id):
                 return {"running": True, "cluster_id": cluster_id}
             # Fallback to PID file.
             pid_data = _read_watcher_pid_file(cluster_id)
-            if pid_data and _is_process_alive(pid_data["pid"]):
+            if pid_data and _pid_file_watcher_alive(cluster_id, pid_data):
                 return {"running": True, "cluster_id": pid_data.get("cluster_id")}
             if pid_data:
                 _remove_watcher_pid_file(cluster_id)
             return {"running": False, "cluster_id": cluster_id}
 
         # Global summary across all clusters.
-        active_cluster_ids: list[int] = []
-
-        # Check local processes.
-        for cid, proc in _watcher_processes.items():
-            if proc.poll() is None and cid not in active_cluster_ids:
-                active_cluster_ids.append(cid)
+        active_cluster_ids: list[int] = [
+            cid for cid in _watcher_threads if _local_watcher_running(cid)
+        ]
 
         # Check PID files for any additional clusters.
         _ensure_kubeconfigs_dir()
@@ -358,7 +591,7 @@ def watcher_status(cluster_id: int | None = None) -> dict[str, Any]:
             if cid in active_cluster_ids:
                 continue
             pid_data = _read_watcher_pid_file(cid)
-            if pid_data and _is_process_alive(pid_data["pid"]):
+            if pid_data and _pid_file_watcher_alive(cid, pid_data):
                 active_cluster_ids.append(cid)
             elif pid_data:
                 _remove_watcher_pid_file(cid)
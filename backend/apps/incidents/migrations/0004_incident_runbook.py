@@ -0,0 +1,23 @@
+# Generated by Django 4.2.16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("incidents", "0003_incident_cluster"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="incident",
+            name="runbook_md",
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name="incident",
+            name="runbook_key",
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+    ]
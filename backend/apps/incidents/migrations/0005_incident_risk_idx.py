@@ -0,0 +1,20 @@
+# Generated by Django 4.2.16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("incidents", "0004_incident_runbook"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="incident",
+            index=models.Index(
+                fields=["service_name", "namespace", "status", "severity"],
+                name="incident_risk_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("incidents", "0005_incident_risk_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="incident",
+            index=models.Index(
+                fields=["pod_name", "namespace", "-occurred_at"],
+                name="incident_pod_recent_idx",
+            ),
+        ),
+    ]
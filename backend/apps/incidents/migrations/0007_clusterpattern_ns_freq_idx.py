@@ -0,0 +1,17 @@
+# Generated by Django 4.2.16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("incidents", "0006_incident_pod_recent_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="clusterpattern",
+            index=models.Index(fields=["namespace", "-frequency"], name="pattern_ns_freq_idx"),
+        ),
+    ]
@@ -46,6 +46,8 @@ class Incident(models.Model):
     description = models.TextField()
     raw_logs = models.TextField(blank=True)
     ai_analysis = models.TextField(blank=True)
+    runbook_md = models.TextField(blank=True)
+    runbook_key = models.CharField(max_length=64, blank=True, db_index=True)
     chroma_id = models.CharField(max_length=255, blank=True)
     neo4j_id = models.CharField(max_length=255, blank=True)
     occurred_at = models.DateTimeField(db_index=True)
@@ -56,6 +58,18 @@ class Incident(models.Model):
 
     class Meta:
         ordering = ["-occurred_at"]
+        indexes = [
+            # Pre-deploy risk check: open incidents per service, counted by severity.
+            models.Index(
+                fields=["service_name", "namespace", "status", "severity"],
+                name="incident_risk_idx",
+            ),
+            # Newest incident(s) for a pod: chat analyze_pod / get_pod_timeline.
+            models.Index(
+                fields=["pod_name", "namespace", "-occurred_at"],
+                name="incident_pod_recent_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.incident_type} — {self.pod_name} ({self.namespace})"
@@ -98,6 +112,10 @@ class ClusterPattern(models.Model):
     class Meta:
         ordering = ["-frequency"]
         unique_together = [("pod_name", "namespace", "incident_type")]
+        indexes = [
+            # Top patterns, optionally per namespace: ORDER BY frequency DESC.
+            models.Index(fields=["namespace", "-frequency"], name="pattern_ns_freq_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.incident_type} on {self.pod_name} x{self.frequency}"
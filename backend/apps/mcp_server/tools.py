@@ -4,6 +4,8 @@ Execute tools in-process; used by both stdio MCP and WebSocket chat.
 """
 from typing import Any
 
+from asgiref.sync import sync_to_async
+
 
 def execute_tool(name: str, arguments: dict[str, Any]) -> str:
     """
@@ -52,6 +54,22 @@ def execute_tool(name: str, arguments: dict[str, Any]) -> str:
         )
 
 
+async def aexecute_tool(
+    name: str,
+    arguments: dict[str, Any],
+    preview: int = 500,
+) -> tuple[str, str]:
+    """
+    Async variant of execute_tool for the WebSocket chat agent.
+    The tools use the Django ORM, ChromaDB and Neo4j (all sync), so they run in asgiref's
+    non-thread-sensitive pool: concurrent chats don't queue behind a single sync thread.
+    Returns (full_result, preview_result): the full text goes back to the LLM, the preview
+    (first `preview` chars, computed once here) is what the client is shown.
+    """
+    result = await sync_to_async(execute_tool, thread_sensitive=False)(name, arguments)
+    return result, result if len(result) <= preview else result[:preview]
+
+
 def get_ollama_tools() -> list[dict[str, Any]]:
     """Return tool definitions in Ollama /api/chat format (type: function, function: { name, description, parameters })."""
     return [
@@ -3,8 +3,10 @@ Neo4j graph database operations for KubeMemory.
 Builds a causal knowledge graph of cluster incidents.
 All connection config from environment variables.
 """
+import atexit
 import logging
 import os
+import threading
 from typing import Any
 
 import neo4j
@@ -23,7 +25,11 @@ class KubeGraphBuilder:
         password = os.environ.get("NEO4J_PASSWORD")
         if not password:
             logger.warning("NEO4J_PASSWORD not set; Neo4j operations may fail.")
-        self._driver = neo4j.GraphDatabase.driver(uri, auth=(user, password or ""))
+        self._driver = neo4j.GraphDatabase.driver(
+            uri,
+            auth=(user, password or ""),
+            max_connection_pool_size=int(os.environ.get("NEO4J_MAX_POOL_SIZE") or 16),
+        )
         self._verify_connectivity()
 
     def _verify_connectivity(self) -> None:
@@ -405,3 +411,29 @@ class KubeGraphBuilder:
             }
             for r in rows
         ]
+
+
+# Process-wide builder for request paths. The Neo4j driver pools sessions and is
+# thread-safe, so one instance serves all requests; close() is left to interpreter exit.
+_GRAPH: KubeGraphBuilder | None = None
+_graph_lock = threading.Lock()
+
+
+def get_shared_graph() -> KubeGraphBuilder:
+    """Return the shared KubeGraphBuilder, creating it on first use. Do not close() it."""
+    global _GRAPH
+    if _GRAPH is None:
+        with _graph_lock:
+            if _GRAPH is None:
+                _GRAPH = KubeGraphBuilder()
+    return _GRAPH
+
+
+@atexit.register
+def _close_shared_graph() -> None:
+    """Close the shared Neo4j driver on interpreter shutdown."""
+    if _GRAPH is not None:
+        try:
+            _GRAPH.close()
+        except Exception:
+            pass
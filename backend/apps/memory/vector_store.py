@@ -47,6 +47,10 @@ class IncidentVectorStore:
             logger.error(msg)
             raise ConnectionError(msg) from e
 
+    def embed(self, text: str) -> list[float]:
+        """Public embedding hook so callers can compute a query vector once and reuse it."""
+        return self._embed_text(text)
+
     def embed_incident(self, incident: Incident) -> str:
         """
         Build embedding text from incident, add to collection, return Chroma document ID.
@@ -85,30 +89,33 @@ class IncidentVectorStore:
         )
         return doc_id
 
-    def search_similar(
-        self,
-        query: str,
-        n_results: int = 5,
+    @staticmethod
+    def _build_where(
         filter_namespace: str | None = None,
         doc_type: str | None = None,
-    ) -> list[dict[str, Any]]:
-        """
-        Embed query, search collection with optional namespace and doc_type filter.
-        doc_type: "incident", "fix", or "correction" to restrict results.
-        Returns list of dicts: incident_id, similarity_score, metadata, document.
-        """
+        exclude_doc_types: list[str] | None = None,
+    ) -> dict[str, Any] | None:
+        """Build a Chroma where clause from optional namespace and doc_type filters."""
         where_clauses: list[dict[str, Any]] = []
         if filter_namespace:
             where_clauses.append({"namespace": filter_namespace})
         if doc_type:
             where_clauses.append({"doc_type": doc_type})
-        where = (
+        if exclude_doc_types:
+            where_clauses.append({"doc_type": {"$nin": list(exclude_doc_types)}})
+        return (
             {"$and": where_clauses}
             if len(where_clauses) > 1
             else (where_clauses[0] if where_clauses else None)
         )
 
-        query_embedding = self._embed_text(query)
+    def _query_by_embedding(
+        self,
+        query_embedding: list[float],
+        n_results: int,
+        where: dict[str, Any] | None,
+    ) -> list[dict[str, Any]]:
+        """Run one HNSW search with a precomputed embedding; return result dicts."""
         result = self._collection.query(
             query_embeddings=[query_embedding],
             n_results=n_results,
@@ -136,6 +143,52 @@ class IncidentVectorStore:
             })
         return out
 
+    def search_similar(
+        self,
+        query: str,
+        n_results: int = 5,
+        filter_namespace: str | None = None,
+        doc_type: str | None = None,
+        exclude_doc_types: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Embed query, search collection with optional namespace and doc_type filter.
+        doc_type: "incident", "fix", or "correction" to restrict results.
+        exclude_doc_types: doc_types to drop inside the index (e.g. ["fix", "correction"]).
+        Returns list of dicts: incident_id, similarity_score, metadata, document.
+        """
+        where = self._build_where(filter_namespace, doc_type, exclude_doc_types)
+        query_embedding = self._embed_text(query)
+        return self._query_by_embedding(query_embedding, n_results, where)
+
+    def search_similar_batch(
+        self,
+        query: str,
+        searches: list[dict[str, Any]],
+        query_embedding: list[float] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Run several filtered searches for the same query text, embedding it only once.
+        Each entry in searches takes search_similar's keyword args
+        (n_results, filter_namespace, doc_type, exclude_doc_types).
+        Returns one result list per entry, in order.
+        Pass query_embedding (from embed()) to skip the embedding call entirely.
+        """
+        if query_embedding is None:
+            query_embedding = self._embed_text(query)
+        return [
+            self._query_by_embedding(
+                query_embedding,
+                spec.get("n_results", 5),
+                self._build_where(
+                    spec.get("filter_namespace"),
+                    spec.get("doc_type"),
+                    spec.get("exclude_doc_types"),
+                ),
+            )
+            for spec in searches
+        ]
+
     def clear_all(self) -> None:
         """
         Remove all documents from the incidents collection (reset for disconnect/null state).
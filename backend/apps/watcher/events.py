@@ -0,0 +1,191 @@
+"""
+Kubernetes Warning events -> incident ingestion.
+Shared by the in-process cluster watcher threads (apps.clusters.watcher_manager) and the
+standalone `manage.py run_watcher` command.
+"""
+import logging
+from typing import Any, Callable
+
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+from kubernetes.watch import Watch
+
+from apps.incidents.tasks import ingest_incident_task
+
+logger = logging.getLogger(__name__)
+
+REASON_TO_TYPE = {
+    "CrashLoopBackOff": "CrashLoopBackOff",
+    "OOMKilling": "OOMKill",
+    "Killing": "CrashLoopBackOff",
+    "BackOff": "CrashLoopBackOff",
+    "Failed": "Unknown",
+    "NodeNotReady": "NodePressure",
+    "Evicted": "Evicted",
+    "ImagePullBackOff": "ImagePullBackOff",
+    "ErrImagePull": "ImagePullBackOff",
+}
+
+REASON_TO_SEVERITY = {
+    "OOMKilling": "critical",
+    "CrashLoopBackOff": "high",
+    "NodeNotReady": "high",
+    "Evicted": "medium",
+    "ImagePullBackOff": "low",
+    "BackOff": "medium",
+}
+
+
+def _read_pod_logs(
+    v1: client.CoreV1Api, namespace: str, pod_name: str, tail_lines: int = 100
+) -> str:
+    """Fetch last N lines of pod logs; return empty string on any error."""
+    try:
+        resp = v1.read_namespaced_pod_log(
+            name=pod_name,
+            namespace=namespace,
+            tail_lines=tail_lines,
+        )
+        return resp or ""
+    except Exception as e:
+        logger.debug("Could not read logs for %s/%s: %s", namespace, pod_name, e)
+        return ""
+
+
+def _extract_service_name(pod: client.V1Pod) -> str:
+    """Best-effort extraction of a logical service name from pod metadata."""
+    meta = getattr(pod, "metadata", None)
+    if not meta:
+        return ""
+    labels = getattr(meta, "labels", None) or {}
+    # Common label conventions
+    for key in ("app.kubernetes.io/name", "app", "k8s-app"):
+        val = labels.get(key)
+        if val:
+            return str(val)
+    # Owner references (e.g. Deployment/StatefulSet)
+    owners = getattr(meta, "owner_references", None) or []
+    for owner in owners:
+        name = getattr(owner, "name", "") or ""
+        if name:
+            return name
+    # Fallback: base of pod name prefix (before first '-')
+    name = getattr(meta, "name", "") or ""
+    if name and "-" in name:
+        return name.split("-", 1)[0]
+    return name
+
+
+def _build_incident_data(
+    v1: client.CoreV1Api,
+    namespace: str,
+    pod_name: str,
+    reason: str,
+    message: str,
+    event_time: Any,
+    node_name: str = "",
+    service_name: str = "",
+    cluster_id: int | None = None,
+) -> dict[str, Any]:
+    """Build incident payload for ingest_incident_task."""
+    incident_type = REASON_TO_TYPE.get(reason, "Unknown")
+    severity = REASON_TO_SEVERITY.get(reason, "medium")
+    raw_logs = _read_pod_logs(v1, namespace, pod_name)
+    occurred_at = event_time.isoformat() if hasattr(event_time, "isoformat") else str(event_time)
+    data: dict[str, Any] = {
+        "pod_name": pod_name,
+        "namespace": namespace,
+        "node_name": node_name or "",
+        "service_name": service_name or "",
+        "incident_type": incident_type,
+        "severity": severity,
+        "description": message or f"{reason}",
+        "raw_logs": raw_logs,
+        "occurred_at": occurred_at,
+    }
+    if cluster_id is not None:
+        data["cluster_id"] = cluster_id
+    return data
+
+
+def dispatch_event(
+    v1: client.CoreV1Api, namespace: str, obj: Any, cluster_id: int | None = None
+) -> None:
+    """Queue ingest_incident_task for a pod Warning/Failed event; ignore anything else."""
+    if not obj or obj.kind != "Event":
+        return
+    reason = getattr(obj, "reason", None) or ""
+    type_ = getattr(obj, "type", None) or ""
+    if type_ not in ("Warning", "Failed"):
+        return
+    message = getattr(obj, "message", None) or ""
+    involved = getattr(obj, "involved_object", None)
+    if not involved or getattr(involved, "kind", None) != "Pod":
+        return
+    pod_name = getattr(involved, "name", None)
+    if not pod_name:
+        return
+    node_name = ""
+    service_name = ""
+    try:
+        pod = v1.read_namespaced_pod(name=pod_name, namespace=namespace)
+        node_name = getattr(pod.spec, "node_name", None) or ""
+        service_name = _extract_service_name(pod)
+    except Exception:
+        pass
+    event_time = getattr(obj, "last_timestamp", None) or getattr(obj, "event_time", None)
+    if not event_time:
+        from django.utils import timezone
+        event_time = timezone.now()
+
+    incident_data = _build_incident_data(
+        v1=v1,
+        namespace=namespace,
+        pod_name=pod_name,
+        reason=reason,
+        message=message,
+        event_time=event_time,
+        node_name=node_name,
+        service_name=service_name,
+        cluster_id=cluster_id,
+    )
+    ingest_incident_task.delay(incident_data)
+    logger.info(
+        "Dispatched incident pod=%s namespace=%s reason=%s",
+        pod_name, namespace, reason,
+    )
+
+
+def watch_namespace(
+    v1: client.CoreV1Api,
+    namespace: str,
+    timeout_seconds: int,
+    cluster_id: int | None = None,
+    should_stop: Callable[[], bool] = lambda: False,
+    resource_version: str | None = None,
+) -> str | None:
+    """
+    Watch one namespace's events for up to timeout_seconds, dispatching incidents.
+    Resumes from resource_version when given (events already seen are not re-listed) and
+    returns the last seen resourceVersion for the next call; None to start over (410 Gone).
+    """
+    w = Watch()
+    kwargs: dict[str, Any] = {"timeout_seconds": timeout_seconds}
+    if resource_version:
+        kwargs["resource_version"] = resource_version
+    try:
+        for event in w.stream(v1.list_namespaced_event, namespace, **kwargs):
+            if should_stop():
+                w.stop()
+                break
+            obj = event.get("object")
+            rv = getattr(getattr(obj, "metadata", None), "resource_version", None)
+            if rv:
+                resource_version = rv
+            dispatch_event(v1, namespace, obj, cluster_id)
+    except ApiException as e:
+        if e.status == 410:  # resourceVersion expired: resume from a fresh list
+            logger.info("Watch for %s expired (410); restarting from current state", namespace)
+            return None
+        raise
+    return resource_version
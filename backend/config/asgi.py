@@ -11,6 +11,11 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
 
 django_asgi_app = get_asgi_application()
 
+# Web server process only (not manage.py commands): prebuild the agents pipeline.
+from apps.agents.warmup import start_warmup  # noqa: E402
+
+start_warmup()
+
 from apps.ws.routing import websocket_urlpatterns
 
 application = ProtocolTypeRouter({
@@ -2,6 +2,7 @@
 Celery app configuration for KubeMemory. Auto-discovers tasks from all installed apps.
 """
 from celery import Celery
+from celery.signals import worker_process_init
 from django.conf import settings
 
 app = Celery("config")
@@ -13,3 +14,11 @@ app.autodiscover_tasks(lambda: [a for a in settings.INSTALLED_APPS if a.startswi
 def debug_task(self):
     """Debug task for testing Celery."""
     print(f"Request: {self.request!r}")
+
+
+@worker_process_init.connect
+def warm_agents(**kwargs) -> None:
+    """Warm the agents pipeline in each pool child (after fork, never in the parent)."""
+    from apps.agents.warmup import start_warmup
+
+    start_warmup()
@@ -6,3 +6,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
 
 application = get_wsgi_application()
+
+# Web server process only (not manage.py commands): prebuild the agents pipeline.
+from apps.agents.warmup import start_warmup  # noqa: E402
+
+start_warmup()
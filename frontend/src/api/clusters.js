@@ -12,6 +12,9 @@ export const fetchCluster = (id) =>
 export const testCluster = (id) =>
   client.post(`/clusters/${id}/test/`).then((r) => r.data)
 
+export const testAllClusters = () =>
+  client.post('/clusters/test-all/').then((r) => r.data)
+
 export const connectCluster = (id) =>
   client.post(`/clusters/${id}/connect/`).then((r) => r.data)
 
@@ -121,6 +121,8 @@ export function useChat(namespace = 'all', { onStreamDone } = {}) {
             if (last && last.role === 'assistant') {
               updated[updated.length - 1] = {
                 ...last,
+                // Present only when the server dropped tokens for a slow connection.
+                ...(event.content != null ? { content: event.content } : {}),
                 streaming: false,
                 id: event.message_id,
                 latency_ms: event.latency_ms,